@@ -6,7 +6,7 @@ import json
 import logging
 import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 
 from classifier.feedback import FeedbackStore
@@ -14,6 +14,12 @@ from classifier.feedback import FeedbackStore
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Key words in error messages: runs of 4+ word characters
+_WORD_RE = re.compile(r"\w{4,}")
+
+# Number of example values reported per suggested pattern
+MAX_EXAMPLES = 3
+
 
 def analyze_patterns(min_occurrences: int = 3) -> dict:
     """
@@ -46,10 +52,14 @@ def analyze_patterns(min_occurrences: int = 3) -> dict:
     for category, items in by_category.items():
         logger.info(f"\n{category}: {len(items)} corrections")
 
-        # Group by error message patterns
-        message_patterns = defaultdict(list)
-        activity_patterns = defaultdict(list)
-        exception_patterns = defaultdict(list)
+        # Tally error message, exception and activity patterns in one pass,
+        # keeping only the few examples that get reported
+        message_counts: Counter[str] = Counter()
+        exception_counts: Counter[str] = Counter()
+        activity_counts: Counter[str] = Counter()
+        message_examples = defaultdict(list)
+        exception_examples = defaultdict(list)
+        activity_examples = defaultdict(list)
 
         for item in items:
             error = item["error"]
@@ -57,52 +67,57 @@ def analyze_patterns(min_occurrences: int = 3) -> dict:
             exception = error.get("exception", "").lower()
             activity = item.get("activity_name", "").lower()
 
-            # Extract key words from message
-            words = re.findall(r"\w+", message)
+            # Extract key words from message (short words never match)
+            words = _WORD_RE.findall(message)
+            message_counts.update(words)
             for word in words:
-                if len(word) > 3:  # Skip short words
-                    message_patterns[word].append(item)
+                if len(message_examples[word]) < MAX_EXAMPLES:
+                    message_examples[word].append(error.get("message", "")[:100])
 
             if exception:
-                exception_patterns[exception].append(item)
+                exception_counts[exception] += 1
+                if len(exception_examples[exception]) < MAX_EXAMPLES:
+                    exception_examples[exception].append(error.get("exception", ""))
 
             if activity:
-                activity_patterns[activity].append(item)
+                activity_counts[activity] += 1
+                if len(activity_examples[activity]) < MAX_EXAMPLES:
+                    activity_examples[activity].append(item.get("activity_name", ""))
 
         # Find patterns that occur frequently
         category_suggestions = []
 
         # Message patterns
-        for pattern, matches in message_patterns.items():
-            if len(matches) >= min_occurrences:
+        for pattern, count in message_counts.items():
+            if count >= min_occurrences:
                 category_suggestions.append({
                     "type": "message",
                     "pattern": pattern,
-                    "count": len(matches),
-                    "suggested_rule": f'(r"{pattern}", "{category}", "Pattern from {len(matches)} user corrections")',
-                    "examples": [m["error"].get("message", "")[:100] for m in matches[:3]]
+                    "count": count,
+                    "suggested_rule": f'(r"{pattern}", "{category}", "Pattern from {count} user corrections")',
+                    "examples": message_examples[pattern],
                 })
 
         # Exception patterns
-        for pattern, matches in exception_patterns.items():
-            if len(matches) >= min_occurrences:
+        for pattern, count in exception_counts.items():
+            if count >= min_occurrences:
                 category_suggestions.append({
                     "type": "exception",
                     "pattern": pattern,
-                    "count": len(matches),
-                    "suggested_rule": f'(r"{pattern}", "{category}", "Exception pattern from {len(matches)} corrections")',
-                    "examples": [m["error"].get("exception", "") for m in matches[:3]]
+                    "count": count,
+                    "suggested_rule": f'(r"{pattern}", "{category}", "Exception pattern from {count} corrections")',
+                    "examples": exception_examples[pattern],
                 })
 
         # Activity patterns
-        for pattern, matches in activity_patterns.items():
-            if len(matches) >= min_occurrences:
+        for pattern, count in activity_counts.items():
+            if count >= min_occurrences:
                 category_suggestions.append({
                     "type": "activity",
                     "pattern": pattern,
-                    "count": len(matches),
-                    "suggested_rule": f"# Activity-specific: {pattern} → {category} ({len(matches)} corrections)",
-                    "examples": [m.get("activity_name", "") for m in matches[:3]]
+                    "count": count,
+                    "suggested_rule": f"# Activity-specific: {pattern} → {category} ({count} corrections)",
+                    "examples": activity_examples[pattern],
                 })
 
         if category_suggestions:
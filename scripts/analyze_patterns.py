@@ -2,7 +2,7 @@
 """Analyze LLM-classified errors to suggest new rule patterns.
 
 This script helps you improve the rule-based classifier by:
-1. Finding errors that were classified by LLM (not rules)
+1. Finding errors that were classified by LLM (not rules), including cached LLM results
 2. Identifying common patterns in those errors
 3. Suggesting new regex patterns to add to rules.py
 
@@ -19,96 +19,161 @@ Usage:
 
 import argparse
 import logging
+import multiprocessing
 import re
 import sys
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from analyzer import FailureAnalyzerJob
 
+if TYPE_CHECKING:
+    from analyzer.job import AnalysisResult
+
 logger = logging.getLogger(__name__)
 
+MAX_SAMPLE_ERRORS = 3  # Example errors shown per category
+
+
+# Exception types (e.g., ValueError, KeyError)
+_EXCEPTION_RE = re.compile(r"\b\w+(?:Error|Exception)\b")
+
+# Common error phrases: "X failed", "X error", "X not found", etc., each
+# with the literal words it needs so it is only run when one is present
+_PHRASE_RES = [
+    (re.compile(r"(\w+)\s+(?:failed|error|exception)"), frozenset({"failed", "error", "exception"})),
+    (re.compile(r"(?:failed|error)\s+(\w+)"), frozenset({"failed", "error"})),
+    (re.compile(r"(\w+)\s+not\s+found"), frozenset({"found"})),
+    (re.compile(r"invalid\s+(\w+)"), frozenset({"invalid"})),
+    (re.compile(r"missing\s+(\w+)"), frozenset({"missing"})),
+    (re.compile(r"(\w+)\s+timeout"), frozenset({"timeout"})),
+    (re.compile(r"(\w+)\s+refused"), frozenset({"refused"})),
+]
+
+# One pass finding every trigger word (lookahead, so overlapping ones like "errorefused" all count)
+_TRIGGER_RE = re.compile(
+    "(?=(" + "|".join(sorted(set().union(*(triggers for _, triggers in _PHRASE_RES)))) + "))"
+)
+
+# HTTP status codes
+_HTTP_CODE_RE = re.compile(r"\b[4-5]\d{2}\b")
+
 
 def extract_keywords(text: str) -> list[str]:
     """Extract potential keywords from error text."""
     # Convert to lowercase
     text = text.lower()
 
-    # Extract exception types (e.g., ValueError, KeyError)
-    exceptions = re.findall(r"\b\w+(?:Error|Exception)\b", text)
+    exceptions = _EXCEPTION_RE.findall(text)
 
-    # Extract common error phrases
     phrases = []
+    present = set(_TRIGGER_RE.findall(text))
+    if present:
+        for pattern, triggers in _PHRASE_RES:
+            if not triggers.isdisjoint(present):
+                phrases.extend(pattern.findall(text))
 
-    # Look for "X failed", "X error", "X not found", etc.
-    patterns = [
-        r"(\w+)\s+(?:failed|error|exception)",
-        r"(?:failed|error)\s+(\w+)",
-        r"(\w+)\s+not\s+found",
-        r"invalid\s+(\w+)",
-        r"missing\s+(\w+)",
-        r"(\w+)\s+timeout",
-        r"(\w+)\s+refused",
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        phrases.extend(matches)
-
-    # Extract HTTP status codes
-    http_codes = re.findall(r"\b[4-5]\d{2}\b", text)
+    http_codes = _HTTP_CODE_RE.findall(text)
 
     return exceptions + phrases + http_codes
 
 
-def suggest_patterns(results: list[dict], min_count: int = 3, top_n: int = 10) -> dict:
-    """Analyze LLM-classified errors and suggest new patterns."""
-    # Group by category
-    by_category = defaultdict(list)
+def _tally_errors(results: Iterable["AnalysisResult"]) -> dict[str, dict]:
+    """
+    Tally LLM-classified errors per category.
+
+    Keeps keyword counts, the error count and the first few errors as
+    samples, updated as we go so error texts are not all held in memory.
+    """
+    by_category: dict[str, dict] = defaultdict(lambda: {"keywords": Counter(), "total": 0, "samples": []})
 
     for result in results:
-        for classification in result.get("classifications", []):
-            if classification.get("classified_by") == "llm":
-                category = classification.get("category")
-                error = classification.get("original_error", {})
+        for classification in result.classifications:
+            if classification.classified_by in ("llm", "cache"):
+                category = classification.category.value
+                error = classification.original_error
 
                 # Combine all error text
-                text = " ".join([
-                    str(error.get("message", "")),
-                    str(error.get("exception", "")),
-                    str(error.get("details", "")),
-                ])
-
-                by_category[category].append({
-                    "text": text,
-                    "activity": classification.get("activity_name"),
-                    "reasoning": classification.get("reasoning"),
-                })
+                text = f"{error.get('message', '')} {error.get('exception', '')} {error.get('details', '')}"
+
+                stats = by_category[category]
+                stats["keywords"].update(extract_keywords(text))
+                stats["total"] += 1
+                if len(stats["samples"]) < MAX_SAMPLE_ERRORS:
+                    stats["samples"].append({
+                        "text": text,
+                        "activity": classification.activity_name,
+                        "reasoning": classification.reasoning,
+                    })
+
+    return dict(by_category)  # Plain dict so it can be returned from a worker process
+
+
+def _tally_errors_parallel(results: list["AnalysisResult"], workers: int) -> dict[str, dict]:
+    """
+    Tally errors like _tally_errors, splitting results across worker processes.
+
+    Results are split into contiguous shards and merged in order, so the
+    counts, samples and tie-breaking order match a single-process tally.
+    """
+    shard_size = -(-len(results) // workers)  # ceil
+    shards = [results[start:start + shard_size] for start in range(0, len(results), shard_size)]
+
+    with multiprocessing.Pool(processes=len(shards)) as pool:
+        tallies = pool.map(_tally_errors, shards)
+
+    merged: dict[str, dict] = {}
+    for tally in tallies:
+        for category, stats in tally.items():
+            if category not in merged:
+                merged[category] = stats
+                continue
+            into = merged[category]
+            into["keywords"] += stats["keywords"]
+            into["total"] += stats["total"]
+            into["samples"].extend(stats["samples"][:MAX_SAMPLE_ERRORS - len(into["samples"])])
+    return merged
+
+
+def suggest_patterns(
+    results: Iterable["AnalysisResult"],
+    min_count: int = 3,
+    top_n: int = 10,
+    workers: int = 1,
+) -> dict:
+    """
+    Analyze LLM-classified errors and suggest new patterns.
+
+    Args:
+        results: Analysis results to mine
+        min_count: Minimum occurrences for a keyword to be suggested
+        top_n: Number of top keywords per category
+        workers: Processes to extract keywords with (1 = in this process)
+    """
+    if workers > 1 and len(results := list(results)) > 1:
+        by_category = _tally_errors_parallel(results, workers)
+    else:
+        by_category = _tally_errors(results)
 
     # Analyze patterns for each category
     suggestions = {}
 
-    for category, errors in by_category.items():
-        # Extract keywords from all errors
-        keyword_counter = Counter()
-
-        for error in errors:
-            keywords = extract_keywords(error["text"])
-            keyword_counter.update(keywords)
-
+    for category, stats in by_category.items():
         # Get top keywords
-        top_keywords = keyword_counter.most_common(top_n)
+        top_keywords = stats["keywords"].most_common(top_n)
 
         # Filter by minimum count
         top_keywords = [(kw, count) for kw, count in top_keywords if count >= min_count]
 
         suggestions[category] = {
-            "total_llm_classified": len(errors),
+            "total_llm_classified": stats["total"],
             "top_keywords": top_keywords,
-            "sample_errors": errors[:3],  # Show 3 examples
+            "sample_errors": stats["samples"],
         }
 
     return suggestions
@@ -170,6 +235,12 @@ def main() -> int:
         default=10,
         help="Number of top patterns to show per category (default: 10)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to extract keywords, for very large runs (default: 1)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -194,9 +265,10 @@ def main() -> int:
 
         # Get suggestions
         suggestions = suggest_patterns(
-            summary.to_dict()["results"],
+            summary.results,
             min_count=args.min_count,
             top_n=args.top,
+            workers=args.workers,
         )
 
         # Print suggestions
@@ -13,6 +13,8 @@ from classifier.feedback import FeedbackStore
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+_VALID_CATEGORIES = frozenset(c.value for c in FailureCategory)
+
 
 def import_corrections_from_csv(csv_file: Path, user: str | None = None) -> int:
     """
@@ -31,34 +33,43 @@ def import_corrections_from_csv(csv_file: Path, user: str | None = None) -> int:
         Number of corrections imported
     """
     feedback_store = FeedbackStore()
-    corrections_count = 0
+    pending: list[dict] = []
 
     with open(csv_file) as f:
-        reader = csv.DictReader(f)
+        # Plain reader with header positions resolved once, rather than a dict per row
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        columns = {name: i for i, name in enumerate(fieldnames)}
 
         # Validate required columns
         required_cols = ["Job ID", "Activity Name", "Error Category", "Error Message"]
-        missing_cols = [col for col in required_cols if col not in reader.fieldnames]
+        missing_cols = [col for col in required_cols if col not in columns]
         if missing_cols:
             logger.error(f"Missing required columns: {missing_cols}")
-            logger.error(f"Available columns: {reader.fieldnames}")
+            logger.error(f"Available columns: {fieldnames}")
             return 0
 
+        def get(row: list[str], name: str) -> str:
+            """Value of a column in row ("" if the column or cell is missing)."""
+            i = columns.get(name)
+            return row[i] if i is not None and i < len(row) else ""
+
         for row in reader:
-            job_id = row["Job ID"]
-            activity_name = row["Activity Name"]
-            original_category = row["Error Category"]
+            if not row:
+                continue
+
+            job_id = get(row, "Job ID")
+            activity_name = get(row, "Activity Name")
+            original_category = get(row, "Error Category")
 
             # Check if there's a correction
-            corrected_category = row.get("Corrected Category", "").strip()
+            corrected_category = get(row, "Corrected Category").strip()
             if not corrected_category or corrected_category == original_category:
                 # No correction needed
                 continue
 
             # Validate corrected category
-            try:
-                FailureCategory(corrected_category)
-            except ValueError:
+            if corrected_category not in _VALID_CATEGORIES:
                 logger.warning(
                     f"Invalid category '{corrected_category}' for job {job_id}, skipping"
                 )
@@ -66,33 +77,31 @@ def import_corrections_from_csv(csv_file: Path, user: str | None = None) -> int:
 
             # Build error dict from CSV
             error = {
-                "code": row.get("Error Code", ""),
-                "message": row.get("Error Message", ""),
-                "exception": row.get("Exception Type", ""),
+                "code": get(row, "Error Code"),
+                "message": get(row, "Error Message"),
+                "exception": get(row, "Exception Type"),
                 "details": {}
             }
 
             # Get notes if available
-            notes = row.get("Notes", "") or row.get("Reasoning", "")
-
-            # Add correction
-            feedback_store.add_correction(
-                job_id=job_id,
-                activity_name=activity_name,
-                error=error,
-                original_category=original_category,
-                corrected_category=corrected_category,
-                user=user,
-                notes=notes,
-            )
-
-            corrections_count += 1
-            logger.info(
+            notes = get(row, "Notes") or get(row, "Reasoning")
+
+            # Queue correction; all are written in one go below
+            pending.append({
+                "job_id": job_id,
+                "activity_name": activity_name,
+                "error": error,
+                "original_category": original_category,
+                "corrected_category": corrected_category,
+                "user": user,
+                "notes": notes,
+            })
+            logger.debug(
                 f"Imported correction: {original_category} → {corrected_category} "
                 f"(job {job_id[:8]}...)"
             )
 
-    return corrections_count
+    return feedback_store.add_corrections(pending)
 
 
 def main() -> int:
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -13,8 +13,24 @@ from db import get_db_session, get_failed_jobs
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
 
-@dataclass
+    def dumps_summary(summary: "AnalysisSummary", indent: bool = False) -> str:
+        """Serialize an AnalysisSummary to JSON using orjson."""
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(summary, default=_encode_summary_object, option=option).decode()
+
+except ImportError:  # orjson is an optional speedup (pip install ds-job-insights[fast])
+
+    def dumps_summary(summary: "AnalysisSummary", indent: bool = False) -> str:
+        """Serialize an AnalysisSummary to JSON using the standard library."""
+        return json.dumps(summary, indent=2 if indent else None, cls=SummaryEncoder)
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of analyzing a single job execution."""
 
@@ -31,15 +47,12 @@ class AnalysisResult:
     def __post_init__(self) -> None:
         """Calculate derived fields."""
         # Count by category
-        counts: dict[str, int] = defaultdict(int)
-        for c in self.classifications:
-            counts[c.category.value] += 1
-        self.by_category = dict(counts)
+        counts = Counter(c.category for c in self.classifications)
+        self.by_category = {category.value: count for category, count in counts.items()}
 
         # Determine primary category
         if counts:
-            primary = max(counts.items(), key=lambda x: x[1])[0]
-            self.primary_category = FailureCategory(primary)
+            self.primary_category = counts.most_common(1)[0][0]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage/reporting."""
@@ -56,7 +69,7 @@ class AnalysisResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisSummary:
     """Summary of all analyzed jobs."""
 
@@ -69,22 +82,50 @@ class AnalysisSummary:
     by_tenant: dict[str, int]
     by_pipeline: dict[str, int]
     results: list[AnalysisResult]
+    skipped_count: int = 0  # Failed jobs that could not be analyzed (malformed data or classifier error)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage/reporting."""
+        return {**self._header_dict(), "results": [r.to_dict() for r in self.results]}
+
+    def _header_dict(self) -> dict[str, Any]:
+        """Everything in to_dict() except the per-job results."""
         return {
             "analyzed_at": self.analyzed_at.isoformat(),
             "period_start": self.period_start.isoformat(),
             "period_end": self.period_end.isoformat(),
             "total_jobs": self.total_jobs,
             "total_errors": self.total_errors,
+            "skipped_count": self.skipped_count,
             "by_category": self.by_category,
             "by_tenant": self.by_tenant,
             "by_pipeline": self.by_pipeline,
-            "results": [r.to_dict() for r in self.results],
         }
 
 
+def _encode_summary_object(o: Any) -> Any:
+    """Convert analysis objects lazily for a JSON encoder; anything else falls back to str()."""
+    if isinstance(o, AnalysisSummary):
+        return {**o._header_dict(), "results": o.results}
+    if isinstance(o, AnalysisResult):
+        return o.to_dict()
+    return str(o)
+
+
+class SummaryEncoder(json.JSONEncoder):
+    """
+    JSON encoder for AnalysisSummary that converts results one at a time.
+
+    json.dumps(summary, cls=SummaryEncoder) produces the same document as
+    json.dumps(summary.to_dict(), default=str) without first building the
+    dict for every result.
+    """
+
+    def default(self, o: Any) -> Any:
+        """Convert analysis objects lazily; anything else falls back to str()."""
+        return _encode_summary_object(o)
+
+
 class FailureAnalyzerJob:
     """
     Daily job that analyzes failed job executions.
@@ -97,8 +138,14 @@ class FailureAnalyzerJob:
         self,
         use_llm: bool = True,
         lookback_hours: int = 24,
+        use_cache: bool = True,
+        max_workers: int = 4,
     ) -> None:
-        self.classifier = FailureClassifier(use_llm_fallback=use_llm)
+        self.classifier = FailureClassifier(
+            use_llm_fallback=use_llm,
+            use_cache=use_cache,
+            llm_max_workers=max_workers,
+        )
         self.lookback_hours = lookback_hours
 
     def run(
@@ -137,12 +184,37 @@ class FailureAnalyzerJob:
 
         logger.info(f"Found {len(jobs)} failed jobs to analyze")
 
-        # Analyze each job
-        results: list[AnalysisResult] = []
+        # Pass 1: rule-based classification of every job's errors (fast, local)
+        staged: list[tuple[dict[str, Any], list[ClassifiedFailure | None]]] = []
+        unmatched: list[tuple[dict[str, Any], str | None]] = []
+        skipped = 0
         for job in jobs:
-            result = self._analyze_job(job)
-            if result:
-                results.append(result)
+            errors = self._job_errors(job)
+            if errors is None:
+                skipped += 1
+                continue
+            if not errors:
+                continue
+
+            try:
+                by_rules = self.classifier.classify_many_by_rules(errors)
+            except Exception as e:
+                logger.error(f"Failed to classify errors of job {job['id']}: {e}")
+                skipped += 1
+                continue
+
+            staged.append((job, by_rules))
+            unmatched.extend(pair for pair, r in zip(errors, by_rules, strict=True) if r is None)
+
+        # Pass 2: batched LLM fallback for everything the rules missed, across all jobs
+        logger.info(f"{len(unmatched)} errors not matched by rules")
+        fallback = iter(self.classifier.classify_fallback(unmatched))
+
+        # Analyze each job
+        results = [
+            self._analyze_job(job, [r if r is not None else next(fallback) for r in by_rules])
+            for job, by_rules in staged
+        ]
 
         # Build summary
         summary = self._build_summary(
@@ -150,62 +222,89 @@ class FailureAnalyzerJob:
             analyzed_at=now,
             period_start=since,
             period_end=until,
+            skipped_count=skipped,
         )
 
         logger.info(
             f"Analysis complete: {summary.total_jobs} jobs, "
             f"{summary.total_errors} errors, "
+            f"{summary.skipped_count} skipped, "
             f"categories: {summary.by_category}"
         )
 
         return summary
 
-    def _analyze_job(self, job: dict[str, Any]) -> AnalysisResult | None:
-        """Analyze a single job execution."""
-        try:
-            data = job.get("data", {})
-            run_info = data.get("run_info", {})
-
-            if not run_info.get("errors"):
-                return None
-
-            classifications = self.classifier.classify_job_errors(run_info)
-
-            return AnalysisResult(
-                job_id=job["id"],
-                pipeline_id=job["pipeline_id"],
-                pipeline_name=job.get("pipeline_name"),
-                tenant_id=job["tenant_id"],
-                finished_at=job.get("finished_at"),
-                total_errors=len(classifications),
-                classifications=classifications,
-            )
-        except Exception as e:
-            logger.error(f"Failed to analyze job {job.get('id')}: {e}")
+    def _job_errors(self, job: dict[str, Any]) -> list[tuple[dict[str, Any], str | None]] | None:
+        """
+        Extract the errors of a job execution as (error, activity_name) pairs.
+
+        Returns:
+            List of pairs (empty if the job has no errors), or None if the
+            job is missing required fields or its errors are malformed
+        """
+        missing = [key for key in ("id", "pipeline_id", "tenant_id") if key not in job]
+        if missing:
+            logger.error(f"Skipping job {job.get('id')}: missing {', '.join(missing)}")
             return None
 
+        data = job.get("data") or {}
+        if not isinstance(data, dict):
+            logger.error(f"Skipping job {job['id']}: data is not a mapping")
+            return None
+
+        run_info = data.get("run_info") or {}
+        if not isinstance(run_info, dict):
+            logger.error(f"Skipping job {job['id']}: run_info is not a mapping")
+            return None
+
+        errors_by_activity = run_info.get("errors")
+        if not errors_by_activity:
+            return []
+
+        if not isinstance(errors_by_activity, dict) or not all(
+            isinstance(activity_errors, list) for activity_errors in errors_by_activity.values()
+        ):
+            logger.error(f"Skipping job {job['id']}: run_info.errors is not a mapping of activity to error list")
+            return None
+
+        return [
+            (error, activity_name)
+            for activity_name, activity_errors in errors_by_activity.items()
+            for error in activity_errors
+        ]
+
+    def _analyze_job(
+        self,
+        job: dict[str, Any],
+        classifications: list[ClassifiedFailure],
+    ) -> AnalysisResult:
+        """Build the analysis result for a single job execution."""
+        return AnalysisResult(
+            job_id=job["id"],
+            pipeline_id=job["pipeline_id"],
+            pipeline_name=job.get("pipeline_name"),
+            tenant_id=job["tenant_id"],
+            finished_at=job.get("finished_at"),
+            total_errors=len(classifications),
+            classifications=classifications,
+        )
+
     def _build_summary(
         self,
         results: list[AnalysisResult],
         analyzed_at: datetime,
         period_start: datetime,
         period_end: datetime,
+        skipped_count: int = 0,
     ) -> AnalysisSummary:
         """Build summary from analysis results."""
-        by_category: dict[str, int] = defaultdict(int)
-        by_tenant: dict[str, int] = defaultdict(int)
-        by_pipeline: dict[str, int] = defaultdict(int)
-        total_errors = 0
-
+        by_category: Counter[str] = Counter()
         for result in results:
-            total_errors += result.total_errors
-            by_tenant[result.tenant_id] += 1
-
-            pipeline_key = result.pipeline_name or result.pipeline_id
-            by_pipeline[pipeline_key] += 1
+            by_category.update(result.by_category)
 
-            for cat, count in result.by_category.items():
-                by_category[cat] += count
+        total_errors = sum(result.total_errors for result in results)
+        by_tenant = Counter(result.tenant_id for result in results)
+        by_pipeline = Counter(result.pipeline_name or result.pipeline_id for result in results)
 
         return AnalysisSummary(
             analyzed_at=analyzed_at,
@@ -217,6 +316,7 @@ class FailureAnalyzerJob:
             by_tenant=dict(by_tenant),
             by_pipeline=dict(by_pipeline),
             results=results,
+            skipped_count=skipped_count,
         )
 
 
@@ -227,11 +327,15 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     use_llm = event.get("use_llm", True)
     lookback_hours = event.get("lookback_hours", 24)
+    use_cache = event.get("use_cache", True)
+    max_workers = event.get("max_workers", 4)
     tenant_id = event.get("tenant_id")
 
     job = FailureAnalyzerJob(
         use_llm=use_llm,
         lookback_hours=lookback_hours,
+        use_cache=use_cache,
+        max_workers=max_workers,
     )
 
     summary = job.run(
@@ -240,7 +344,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     return {
         "statusCode": 200,
-        "body": json.dumps(summary.to_dict(), default=str),
+        "body": dumps_summary(summary),
     }
 
 
@@ -250,7 +354,7 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
 
-    job = FailureAnalyzerJob(use_llm="--no-llm" not in sys.argv)
+    job = FailureAnalyzerJob(use_llm="--no-llm" not in sys.argv, use_cache="--no-cache" not in sys.argv)
     summary = job.run()
 
-    print(json.dumps(summary.to_dict(), indent=2, default=str))
+    print(dumps_summary(summary, indent=True))
@@ -0,0 +1,138 @@
+"""Persistent cache of LLM classifications keyed by error content."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from classifier.categories import FailureCategory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = Path.home() / ".cache" / "ds-failure-classifier" / "classifications.sqlite"
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+# Run-specific values (UUIDs, timestamps, long ids) that vary between occurrences of the same failure.
+# Short numbers are kept since they tend to be meaningful (HTTP statuses, line numbers, counts).
+_VOLATILE_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b\d{5,}\b",
+    re.IGNORECASE,
+)
+
+
+def content_key(error: dict[str, Any], version: str = "") -> str:
+    """
+    Hash the parts of an error that identify the underlying failure.
+
+    Only message, exception and code are hashed, with UUIDs, timestamps and
+    long numeric ids in the message masked, so the same failure recurring
+    across jobs and activities gets the same key.
+    """
+    message = _VOLATILE_RE.sub("#", str(error.get("message")))
+    content = f"{version}|{message}|{error.get('exception')}|{error.get('code')}"
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class ClassificationCache:
+    """SQLite-backed cache of (category, confidence, reasoning) per error."""
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        version: str = "",
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize classification cache.
+
+        Args:
+            cache_file: Path to the SQLite file. Defaults to ~/.cache/ds-failure-classifier/classifications.sqlite
+            version: Model/prompt version tag mixed into every key, so changing
+                either never serves classifications produced by the old one
+            ttl_seconds: Age after which an entry is treated as a miss
+        """
+        if cache_file is None:
+            cache_file = DEFAULT_CACHE_FILE
+
+        self.cache_file = cache_file
+        self.version = version
+        self.ttl_seconds = ttl_seconds
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.cache_file)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS classifications (
+                key TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                reasoning TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        # Drop expired rows, including those left behind by older model/prompt versions,
+        # so the file does not grow across runs
+        self._conn.execute(
+            "DELETE FROM classifications WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        self._conn.commit()
+
+    def key(self, error: dict[str, Any]) -> str:
+        """Compute the cache key for an error (see content_key)."""
+        return content_key(error, self.version)
+
+    def get_many(self, keys: list[str]) -> dict[str, tuple[FailureCategory, float, str]]:
+        """
+        Look up several keys at once.
+
+        Returns:
+            Mapping of key -> (category, confidence, reasoning) for fresh hits only
+        """
+        hits: dict[str, tuple[FailureCategory, float, str]] = {}
+        if not keys:
+            return hits
+
+        cutoff = time.time() - self.ttl_seconds
+        unique = list(dict.fromkeys(keys))
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, category, confidence, reasoning FROM classifications "
+                f"WHERE key IN ({placeholders}) AND created_at >= ?",
+                [*chunk, cutoff],
+            )
+            for key, category, confidence, reasoning in rows:
+                try:
+                    hits[key] = (FailureCategory(category), confidence, reasoning)
+                except ValueError:
+                    logger.warning(f"Ignoring cached classification with unknown category {category!r}")
+        return hits
+
+    def put_many(self, entries: dict[str, tuple[FailureCategory, float, str]]) -> None:
+        """Store classifications, replacing any existing entries for the same keys."""
+        if not entries:
+            return
+
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO classifications (key, category, confidence, reasoning, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (key, str(category), confidence, reasoning, now)
+                    for key, (category, confidence, reasoning) in entries.items()
+                ],
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
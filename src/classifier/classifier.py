@@ -1,26 +1,55 @@
 """Main failure classifier - combines rule-based and LLM classification."""
 
+import hashlib
 import json
 import logging
 import os
-import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from classifier.cache import ClassificationCache, content_key
 from classifier.categories import FailureCategory
 from classifier.feedback import FeedbackStore
 from classifier.rules import (
-    INPUT_DATA_PATTERNS,
-    THIRD_PARTY_PATTERNS,
-    WORKFLOW_ENGINE_PATTERNS,
+    INPUT_DATA_RULES,
+    THIRD_PARTY_RULES,
+    WORKFLOW_ENGINE_RULES,
+    build_scanner,
+    compile_lowercase,
+    required_literal,
 )
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# All rules in priority order as (category, label, pattern, reasoning)
+_RULES = [
+    (category, label, pattern, reasoning)
+    for category, label, rules in (
+        (FailureCategory.INPUT_DATA_QUALITY, "INPUT_DATA", INPUT_DATA_RULES),
+        (FailureCategory.THIRD_PARTY_SYSTEM, "THIRD_PARTY", THIRD_PARTY_RULES),
+        (FailureCategory.WORKFLOW_ENGINE, "WORKFLOW_ENGINE", WORKFLOW_ENGINE_RULES),
+    )
+    for pattern, reasoning in rules
+]
+# Matches every rule in one pass over ASCII text when hyperscan is installed, None otherwise
+_RULE_SCANNER = build_scanner([pattern.pattern for _, _, pattern, _ in _RULES])
+# Literal each rule's matches must contain; lets the re path skip most patterns on a substring check
+_RULE_LITERALS = [required_literal(pattern.pattern) for _, _, pattern, _ in _RULES]
+# Same patterns for searching lowercased ASCII text without IGNORECASE; None where the
+# pattern is just its literal, so the substring check already decides the match
+_LOWERCASE_PATTERNS = [
+    None if literal == pattern.pattern.lower() else compile_lowercase(pattern.pattern)
+    for literal, (_, _, pattern, _) in zip(_RULE_LITERALS, _RULES, strict=True)
+]
+
+
+@dataclass(slots=True)
 class ClassifiedFailure:
     """Result of failure classification."""
 
@@ -29,7 +58,7 @@ class ClassifiedFailure:
     reasoning: str
     original_error: dict[str, Any]
     activity_name: str | None = None
-    classified_by: str = "rules"  # "rules", "llm", or "none"
+    classified_by: str = "rules"  # "rules", "llm", "cache", or "none"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -43,7 +72,7 @@ class ClassifiedFailure:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureClassifier:
     """
     Classifies workflow failures into categories.
@@ -61,8 +90,10 @@ class FailureClassifier:
     # LLM configuration
     DEFAULT_LLM_MODEL = "llama3.2:3b"
     DEFAULT_LLM_BASE_URL = "http://localhost:11434/v1"
+    LLM_TIMEOUT_SECONDS = 30  # Per single-error request, and per error in a batch request
+    LLM_MAX_BATCH_TIMEOUT_SECONDS = 120  # Ceiling for one batch request, however many errors it holds
 
-    LLM_SYSTEM_PROMPT = """You are a workflow failure classifier for a data pipeline system.
+    LLM_CATEGORY_GUIDE = """You are a workflow failure classifier for a data pipeline system.
 
 Classify the error into exactly ONE of these categories:
 
@@ -84,7 +115,9 @@ Classify the error into exactly ONE of these categories:
    - HTTP errors, timeouts, connection issues
    - Authentication/authorization failures
    - Rate limiting, quota exceeded
-   - SOAP/GraphQL/REST service errors
+   - SOAP/GraphQL/REST service errors"""
+
+    LLM_SYSTEM_PROMPT = LLM_CATEGORY_GUIDE + """
 
 Respond with JSON only:
 {
@@ -93,13 +126,32 @@ Respond with JSON only:
     "reasoning": "Brief one-sentence explanation"
 }"""
 
+    LLM_BATCH_SYSTEM_PROMPT = LLM_CATEGORY_GUIDE + """
+
+You will be given several numbered errors. Classify each one independently.
+
+Respond with a JSON array only, one object per error:
+[
+    {
+        "idx": 0,
+        "category": "INPUT_DATA_QUALITY|WORKFLOW_ENGINE|THIRD_PARTY_SYSTEM",
+        "confidence": 0.0-1.0,
+        "reasoning": "Brief one-sentence explanation"
+    }
+]"""
+
     use_llm_fallback: bool = True
     use_few_shot_learning: bool = True  # Use corrections as examples in LLM prompt
+    llm_batch_size: int = 25  # Max errors classified per LLM request in batch mode
+    llm_max_workers: int = 4  # Max concurrent LLM requests when classifying many batches
+    use_cache: bool = True  # Reuse LLM classifications of previously seen errors from disk
     _llm_initialized: bool = field(default=False, init=False, repr=False)
     _llm_model: str = field(default="", init=False, repr=False)
     _llm_base_url: str = field(default="", init=False, repr=False)
     _llm_api_key: str = field(default="", init=False, repr=False)
     _feedback_store: FeedbackStore | None = field(default=None, init=False, repr=False)
+    _cache: ClassificationCache | None = field(default=None, init=False, repr=False)
+    _session: requests.Session = field(default_factory=requests.Session, init=False, repr=False)
 
     def _init_llm(self) -> None:
         """Initialize LLM configuration (lazy)."""
@@ -107,10 +159,27 @@ Respond with JSON only:
             self._llm_model = os.getenv("LOCAL_LLM_MODEL", self.DEFAULT_LLM_MODEL)
             self._llm_base_url = os.getenv("LOCAL_LLM_BASE_URL", self.DEFAULT_LLM_BASE_URL)
             self._llm_api_key = os.getenv("LOCAL_LLM_API_KEY", "not-needed")
-            self._feedback_store = FeedbackStore()
+            if self.use_few_shot_learning:
+                self._feedback_store = FeedbackStore()
+            if self.use_cache:
+                self._cache = self._open_cache()
+            # One pooled keep-alive connection per concurrent request
+            adapter = HTTPAdapter(pool_maxsize=max(self.llm_max_workers, 1))
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
             self._llm_initialized = True
             logger.info(f"Initialized LLM classifier: {self._llm_model} at {self._llm_base_url}")
 
+    def _open_cache(self) -> ClassificationCache | None:
+        """Open the classification cache, or return None if it is unavailable."""
+        # Key entries by model and prompts so changing either invalidates old entries
+        prompts = hashlib.sha256((self.LLM_SYSTEM_PROMPT + self.LLM_BATCH_SYSTEM_PROMPT).encode()).hexdigest()
+        try:
+            return ClassificationCache(version=f"{self._llm_model}:{prompts[:12]}")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Classification cache unavailable, continuing without it: {e}")
+            return None
+
     def classify(
         self,
         error: dict[str, Any],
@@ -126,48 +195,183 @@ Respond with JSON only:
         Returns:
             ClassifiedFailure with category, confidence, and reasoning
         """
+        # Stage 1: Rule-based classification
+        classified = self.classify_by_rules(error, activity_name)
+        if classified:
+            return classified
+
+        # Stage 2: LLM fallback for ambiguous cases (UNKNOWN when LLM disabled)
+        return self.classify_fallback([(error, activity_name)])[0]
+
+    def classify_batch(
+        self,
+        errors: list[tuple[dict[str, Any], str | None]],
+    ) -> list[ClassifiedFailure]:
+        """
+        Classify many errors, batching the LLM fallback.
+
+        Rules run on every error first; only the errors they cannot classify
+        go to the LLM, several per request instead of one request each.
+        Repeated errors are classified once and the result shared.
+
+        Args:
+            errors: List of (error, activity_name) pairs
+
+        Returns:
+            List of ClassifiedFailure in the same order as errors
+        """
+        by_rules = self.classify_many_by_rules(errors)
+        fallback = iter(self.classify_fallback([pair for pair, r in zip(errors, by_rules, strict=True) if r is None]))
+        return [r if r is not None else next(fallback) for r in by_rules]
+
+    def classify_by_rules(
+        self,
+        error: dict[str, Any],
+        activity_name: str | None = None,
+    ) -> ClassifiedFailure | None:
+        """
+        Classify a single error using pattern matching rules only.
+
+        Args:
+            error: Error dict with keys: code, message, exception, details
+            activity_name: Optional name of the activity that failed
+
+        Returns:
+            ClassifiedFailure, or None if no rule matched
+        """
+        return self._rules_failure(error, activity_name, self._classify_by_rules(*self._rule_input(error)))
+
+    def classify_many_by_rules(
+        self,
+        errors: list[tuple[dict[str, Any], str | None]],
+    ) -> list[ClassifiedFailure | None]:
+        """
+        Classify errors using pattern matching rules only.
+
+        Errors with identical text and code (e.g. the same exception raised
+        by several activities) are matched against the rules once.
+
+        Args:
+            errors: List of (error, activity_name) pairs
+
+        Returns:
+            List of ClassifiedFailure, or None where no rule matched, in the same order as errors
+        """
+        matched: dict[tuple[str, Any], tuple[FailureCategory, str] | None] = {}
+        results: list[ClassifiedFailure | None] = []
+        for error, activity_name in errors:
+            rule_input = self._rule_input(error)
+            if rule_input not in matched:
+                matched[rule_input] = self._classify_by_rules(*rule_input)
+            results.append(self._rules_failure(error, activity_name, matched[rule_input]))
+        return results
+
+    @staticmethod
+    def _rule_input(error: dict[str, Any]) -> tuple[str, Any]:
+        """Build the (text, code) that rule matching looks at for an error."""
         message = str(error.get("message", ""))
         exception = str(error.get("exception", ""))
         code = error.get("code", 0)
         details = error.get("details", {})
 
-        # Combine text for pattern matching
-        combined_text = f"{message} {exception} {json.dumps(details)}"
+        # Combine text for pattern matching; most errors carry no details, so skip serializing those
+        if details == {}:
+            details_text = "{}"
+        elif details is None:
+            details_text = "null"
+        else:
+            details_text = json.dumps(details)
+        return f"{message} {exception} {details_text}", code
+
+    @staticmethod
+    def _rules_failure(
+        error: dict[str, Any],
+        activity_name: str | None,
+        result: tuple[FailureCategory, str] | None,
+    ) -> ClassifiedFailure | None:
+        """Wrap a rule match as a ClassifiedFailure (None if no rule matched)."""
+        if result is None:
+            return None
+
+        category, reasoning = result
+        return ClassifiedFailure(
+            category=category,
+            confidence=0.9,
+            reasoning=reasoning,
+            original_error=error,
+            activity_name=activity_name,
+            classified_by="rules",
+        )
 
-        # Stage 1: Rule-based classification
-        result = self._classify_by_rules(combined_text, code)
-        if result:
-            category, reasoning = result
-            return ClassifiedFailure(
-                category=category,
-                confidence=0.9,
-                reasoning=reasoning,
-                original_error=error,
-                activity_name=activity_name,
-                classified_by="rules",
-            )
+    def classify_fallback(
+        self,
+        errors: list[tuple[dict[str, Any], str | None]],
+    ) -> list[ClassifiedFailure]:
+        """
+        Classify errors that no rule matched.
+
+        Uses the LLM when enabled, sending up to llm_batch_size errors per
+        request; otherwise every error is returned as UNKNOWN. Errors with the
+        same message, exception and code are sent to the LLM once, and with
+        use_cache, errors classified in earlier runs are answered from the
+        cache.
+
+        Args:
+            errors: List of (error, activity_name) pairs
 
-        # Stage 2: LLM fallback for ambiguous cases
-        if self.use_llm_fallback:
-            category, confidence, reasoning = self._classify_with_llm(error, activity_name)
-            return ClassifiedFailure(
+        Returns:
+            List of ClassifiedFailure in the same order as errors
+        """
+        if not self.use_llm_fallback:
+            # No classification possible
+            return [
+                ClassifiedFailure(
+                    category=FailureCategory.UNKNOWN,
+                    confidence=0.0,
+                    reasoning="No matching patterns and LLM disabled",
+                    original_error=error,
+                    activity_name=activity_name,
+                    classified_by="none",
+                )
+                for error, activity_name in errors
+            ]
+
+        if not errors:
+            return []
+
+        self._init_llm()
+
+        if self._cache is None:
+            keys = [content_key(error) for error, _ in errors]
+            hits = {}
+        else:
+            keys = [self._cache.key(error) for error, _ in errors]
+            hits = self._cache.get_many(keys)
+
+        misses: dict[str, tuple[dict[str, Any], str | None]] = {}
+        for key, pair in zip(keys, errors, strict=True):
+            if key not in hits:
+                misses.setdefault(key, pair)
+        fresh = dict(zip(misses, self._classify_chunks_with_llm(list(misses.values())), strict=True))
+
+        if self._cache is not None:
+            # Don't cache connection/parse failures
+            self._cache.put_many({k: v for k, v in fresh.items() if v[0] != FailureCategory.UNKNOWN})
+        outcomes = [(hits[key], "cache") if key in hits else (fresh[key], "llm") for key in keys]
+
+        return [
+            ClassifiedFailure(
                 category=category,
                 confidence=confidence,
                 reasoning=reasoning,
                 original_error=error,
                 activity_name=activity_name,
-                classified_by="llm",
+                classified_by=classified_by,
             )
-
-        # No classification possible
-        return ClassifiedFailure(
-            category=FailureCategory.UNKNOWN,
-            confidence=0.0,
-            reasoning="No matching patterns and LLM disabled",
-            original_error=error,
-            activity_name=activity_name,
-            classified_by="none",
-        )
+            for (error, activity_name), ((category, confidence, reasoning), classified_by) in zip(
+                errors, outcomes, strict=True
+            )
+        ]
 
     def classify_job_errors(
         self,
@@ -183,15 +387,13 @@ Respond with JSON only:
         Returns:
             List of ClassifiedFailure for each error
         """
-        results = []
         errors_by_activity = run_info.get("errors", {})
 
-        for activity_name, errors in errors_by_activity.items():
-            for error in errors:
-                classified = self.classify(error, activity_name)
-                results.append(classified)
-
-        return results
+        return self.classify_batch([
+            (error, activity_name)
+            for activity_name, errors in errors_by_activity.items()
+            for error in errors
+        ])
 
     def _classify_by_rules(
         self,
@@ -203,23 +405,11 @@ Respond with JSON only:
 
         Returns (category, reasoning) or None if no match.
         """
-        # Check input data patterns
-        for pattern, reasoning in INPUT_DATA_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Matched INPUT_DATA pattern: {pattern}")
-                return (FailureCategory.INPUT_DATA_QUALITY, reasoning)
-
-        # Check third-party patterns
-        for pattern, reasoning in THIRD_PARTY_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Matched THIRD_PARTY pattern: {pattern}")
-                return (FailureCategory.THIRD_PARTY_SYSTEM, reasoning)
-
-        # Check workflow engine patterns
-        for pattern, reasoning in WORKFLOW_ENGINE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Matched WORKFLOW_ENGINE pattern: {pattern}")
-                return (FailureCategory.WORKFLOW_ENGINE, reasoning)
+        index = self._first_matching_rule(text)
+        if index is not None:
+            category, label, pattern, reasoning = _RULES[index]
+            logger.debug(f"Matched {label} pattern: {pattern.pattern}")
+            return (category, reasoning)
 
         # HTTP status code heuristics
         if code is not None and 400 <= code < 500:
@@ -227,6 +417,56 @@ Respond with JSON only:
 
         return None
 
+    @staticmethod
+    def _first_matching_rule(text: str) -> int | None:
+        """Index into _RULES of the first rule matching text, or None."""
+        if not text.isascii():
+            # str.lower() does not fold non-ASCII letters the way re.IGNORECASE does
+            # (e.g. dotless i matches "i"), so neither shortcut is exact here
+            for index, (_, _, pattern, _) in enumerate(_RULES):
+                if pattern.search(text):
+                    return index
+            return None
+
+        if _RULE_SCANNER is not None:
+            return _RULE_SCANNER(text)
+
+        lowered = text.lower()
+        for index, (literal, lowercase_pattern) in enumerate(zip(_RULE_LITERALS, _LOWERCASE_PATTERNS, strict=True)):
+            if (literal is None or literal in lowered) and (
+                lowercase_pattern is None or lowercase_pattern.search(lowered)
+            ):
+                return index
+        return None
+
+    def _classify_chunks_with_llm(
+        self,
+        errors: list[tuple[dict[str, Any], str | None]],
+    ) -> list[tuple[FailureCategory, float, str]]:
+        """
+        Classify errors with the LLM, llm_batch_size errors per request.
+
+        Requests are I/O bound, so up to llm_max_workers of them are kept in
+        flight at once; results keep the order of errors.
+        """
+        self._init_llm()  # Before fanning out, so worker threads never initialize concurrently
+
+        chunks = [errors[start:start + self.llm_batch_size] for start in range(0, len(errors), self.llm_batch_size)]
+        if len(chunks) <= 1 or self.llm_max_workers <= 1:
+            return list(chain.from_iterable(map(self._classify_chunk_with_llm, chunks)))
+
+        with ThreadPoolExecutor(max_workers=min(self.llm_max_workers, len(chunks))) as executor:
+            return list(chain.from_iterable(executor.map(self._classify_chunk_with_llm, chunks)))
+
+    def _classify_chunk_with_llm(
+        self,
+        chunk: list[tuple[dict[str, Any], str | None]],
+    ) -> list[tuple[FailureCategory, float, str]]:
+        """Classify one chunk of errors with a single LLM request."""
+        if len(chunk) == 1:
+            return [self._classify_with_llm(*chunk[0])]
+        return self._classify_batch_with_llm(chunk)
+
     def _classify_with_llm(
         self,
         error: dict[str, Any],
@@ -245,60 +485,13 @@ Respond with JSON only:
         self._init_llm()
 
         # Build user prompt with few-shot examples from corrections
-        user_prompt = ""
-
-        # Add few-shot examples if enabled and available
-        if self.use_few_shot_learning and self._feedback_store:
-            examples = self._feedback_store.get_few_shot_examples(max_examples=5)
-            if examples:
-                user_prompt += "Here are some recent corrections from users:\n\n"
-                for i, example in enumerate(examples, 1):
-                    user_prompt += f"{i}. Activity: {example['activity_name']}\n"
-                    user_prompt += f"   Error: {example['error'].get('message', 'N/A')}\n"
-                    user_prompt += f"   Correct Category: {example['category']}\n"
-                    user_prompt += f"   Reason: {example['reasoning']}\n\n"
-
-                user_prompt += "Now classify this new error:\n\n"
-
-        user_prompt += f"""Activity: {activity_name or 'Unknown'}
-Error Code: {error.get('code')}
-Message: {error.get('message')}
-Exception Type: {error.get('exception')}
-Details: {json.dumps(error.get('details', {}), indent=2)}"""
+        user_prompt = self._few_shot_prompt("Now classify this new error:")
+        user_prompt += self._describe_error(error, activity_name)
 
         try:
-            # Call OpenAI-compatible API
-            response = requests.post(
-                f"{self._llm_base_url}/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self._llm_api_key}",
-                },
-                json={
-                    "model": self._llm_model,
-                    "messages": [
-                        {"role": "system", "content": self.LLM_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    "temperature": 0.1,  # Low temperature for consistent classification
-                    "max_tokens": 200,
-                },
-                timeout=30,
+            content = self._chat_completion(
+                self.LLM_SYSTEM_PROMPT, user_prompt, max_tokens=200, timeout=self.LLM_TIMEOUT_SECONDS
             )
-            response.raise_for_status()
-
-            result = response.json()
-            content = result["choices"][0]["message"]["content"]
-
-            # Extract JSON from response (handle markdown code blocks)
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
 
             # Parse JSON response
             classification = json.loads(content)
@@ -323,3 +516,130 @@ Details: {json.dumps(error.get('details', {}), indent=2)}"""
                 0.0,
                 f"Local LLM classification failed: {e!s}",
             )
+
+    def _classify_batch_with_llm(
+        self,
+        errors: list[tuple[dict[str, Any], str | None]],
+    ) -> list[tuple[FailureCategory, float, str]]:
+        """
+        Classify several errors with a single LLM request.
+
+        Errors the response does not cover (missing, malformed, or an
+        unparseable reply) are retried one at a time with _classify_with_llm.
+        If the LLM cannot be reached or the request times out, every error
+        is returned as UNKNOWN without retrying.
+
+        Args:
+            errors: List of (error, activity_name) pairs
+
+        Returns:
+            List of (category, confidence, reasoning) in the same order as errors
+        """
+        self._init_llm()
+
+        user_prompt = self._few_shot_prompt(f"Now classify these {len(errors)} new errors:")
+        user_prompt += "\n\n".join(
+            f"Error {idx}:\n{self._describe_error(error, activity_name)}"
+            for idx, (error, activity_name) in enumerate(errors)
+        )
+
+        parsed: dict[int, tuple[FailureCategory, float, str]] = {}
+        try:
+            content = self._chat_completion(
+                self.LLM_BATCH_SYSTEM_PROMPT,
+                user_prompt,
+                max_tokens=200 * len(errors),
+                timeout=min(self.LLM_TIMEOUT_SECONDS * len(errors), self.LLM_MAX_BATCH_TIMEOUT_SECONDS),
+            )
+            for item in json.loads(content):
+                try:
+                    parsed[int(item["idx"])] = (
+                        FailureCategory(item["category"]),
+                        float(item["confidence"]),
+                        item["reasoning"],
+                    )
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Skipping malformed LLM batch item {item!r}: {e}")
+
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Cannot connect to local LLM at {self._llm_base_url}: {e}")
+            failure = (FailureCategory.UNKNOWN, 0.0, f"Local LLM connection failed: {e!s}")
+            return [failure] * len(errors)
+        except requests.exceptions.Timeout as e:
+            # Retrying each error would only wait on the same slow LLM once per error
+            logger.error(f"Local LLM at {self._llm_base_url} timed out on a batch of {len(errors)} errors: {e}")
+            failure = (FailureCategory.UNKNOWN, 0.0, f"Local LLM request timed out: {e!s}")
+            return [failure] * len(errors)
+        except Exception as e:
+            logger.warning(f"Local LLM batch classification failed, retrying errors individually: {e}")
+
+        return [
+            parsed[idx] if idx in parsed else self._classify_with_llm(error, activity_name)
+            for idx, (error, activity_name) in enumerate(errors)
+        ]
+
+    def _few_shot_prompt(self, lead_in: str) -> str:
+        """Build the few-shot corrections preamble for an LLM prompt ("" if none)."""
+        if not (self.use_few_shot_learning and self._feedback_store):
+            return ""
+
+        examples = self._feedback_store.get_few_shot_examples(max_examples=5)
+        if not examples:
+            return ""
+
+        prompt = "Here are some recent corrections from users:\n\n"
+        for i, example in enumerate(examples, 1):
+            prompt += f"{i}. Activity: {example['activity_name']}\n"
+            prompt += f"   Error: {example['error'].get('message', 'N/A')}\n"
+            prompt += f"   Correct Category: {example['category']}\n"
+            prompt += f"   Reason: {example['reasoning']}\n\n"
+
+        return prompt + f"{lead_in}\n\n"
+
+    @staticmethod
+    def _describe_error(error: dict[str, Any], activity_name: str | None) -> str:
+        """Format an error for inclusion in an LLM prompt."""
+        return f"""Activity: {activity_name or 'Unknown'}
+Error Code: {error.get('code')}
+Message: {error.get('message')}
+Exception Type: {error.get('exception')}
+Details: {json.dumps(error.get('details', {}), indent=2)}"""
+
+    def _chat_completion(self, system_prompt: str, user_prompt: str, max_tokens: int, timeout: int) -> str:
+        """
+        Call the OpenAI-compatible chat completions API.
+
+        Returns:
+            Response content with any markdown code fence stripped
+        """
+        response = self._session.post(
+            f"{self._llm_base_url}/chat/completions",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self._llm_api_key}",
+            },
+            json={
+                "model": self._llm_model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.1,  # Low temperature for consistent classification
+                "max_tokens": max_tokens,
+            },
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+        result = response.json()
+        content: str = result["choices"][0]["message"]["content"]
+
+        # Extract JSON from response (handle markdown code blocks)
+        content = content.strip()
+        if content.startswith("```json"):
+            content = content[7:]
+        if content.startswith("```"):
+            content = content[3:]
+        if content.endswith("```"):
+            content = content[:-3]
+        return content.strip()
@@ -1,8 +1,11 @@
 """Feedback system for improving LLM classifier with user corrections."""
 
+import heapq
 import json
 import logging
-from datetime import UTC, datetime
+import os
+from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -19,14 +22,26 @@ class FeedbackStore:
         Initialize feedback store.
         
         Args:
-            feedback_file: Path to JSON file storing feedback. Defaults to data/feedback.json
+            feedback_file: Path to JSON lines file storing feedback (one correction per line).
+                Defaults to data/feedback.jsonl
         """
         if feedback_file is None:
-            feedback_file = Path(__file__).parent.parent.parent / "data" / "feedback.json"
+            feedback_file = Path(__file__).parent.parent.parent / "data" / "feedback.jsonl"
 
         self.feedback_file = feedback_file
         self.feedback_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Parsed feedback and the (mtime_ns, size) of the file it was read from
+        self._cached_feedback: list[dict[str, Any]] | None = None
+        self._cached_stat: tuple[int, int] | None = None
+
+        # Convert feedback kept as a single JSON array (the old data/feedback.json format)
+        legacy_file = self.feedback_file.with_suffix(".json")
+        if not self.feedback_file.exists() and legacy_file != self.feedback_file and legacy_file.exists():
+            self._migrate_json_array(legacy_file)
+        elif self.feedback_file.exists():
+            self._migrate_json_array(self.feedback_file)
+
         # Initialize file if it doesn't exist
         if not self.feedback_file.exists():
             self._save_feedback([])
@@ -53,8 +68,6 @@ class FeedbackStore:
             user: Username/email of person making correction
             notes: Optional notes about why this correction was made
         """
-        feedback = self._load_feedback()
-
         correction = {
             "timestamp": datetime.now(UTC).isoformat(),
             "job_id": job_id,
@@ -66,14 +79,46 @@ class FeedbackStore:
             "notes": notes,
         }
 
-        feedback.append(correction)
-        self._save_feedback(feedback)
+        self._append_feedback([correction])
 
         logger.info(
             f"Recorded correction: {original_category} -> {corrected_category} "
             f"for job {job_id}, activity {activity_name}"
         )
 
+    def add_corrections(self, corrections: list[dict[str, Any]]) -> int:
+        """
+        Record several corrections with a single append to the feedback file.
+
+        Args:
+            corrections: Dicts keyed like the add_correction arguments
+                (user and notes are optional)
+
+        Returns:
+            Number of corrections recorded
+        """
+        if not corrections:
+            return 0
+
+        # One microsecond apart, so later rows rank as newer just as with repeated add_correction calls
+        now = datetime.now(UTC)
+        self._append_feedback([
+            {
+                "timestamp": (now + timedelta(microseconds=offset)).isoformat(),
+                "job_id": c["job_id"],
+                "activity_name": c["activity_name"],
+                "error": c["error"],
+                "original_category": c["original_category"],
+                "corrected_category": c["corrected_category"],
+                "user": c.get("user"),
+                "notes": c.get("notes"),
+            }
+            for offset, c in enumerate(corrections)
+        ])
+
+        logger.info(f"Recorded {len(corrections)} corrections")
+        return len(corrections)
+
     def get_corrections(
         self,
         category: FailureCategory | None = None,
@@ -97,13 +142,11 @@ class FeedbackStore:
                 if f["corrected_category"] == category.value
             ]
 
-        # Sort by timestamp (newest first)
-        feedback.sort(key=lambda x: x["timestamp"], reverse=True)
-
+        # Newest first; nlargest only orders the rows it returns
         if limit:
-            feedback = feedback[:limit]
+            return heapq.nlargest(limit, feedback, key=itemgetter("timestamp"))
 
-        return feedback
+        return sorted(feedback, key=itemgetter("timestamp"), reverse=True)
 
     def get_few_shot_examples(self, max_examples: int = 10) -> list[dict[str, Any]]:
         """
@@ -118,8 +161,7 @@ class FeedbackStore:
         feedback = self._load_feedback()
 
         # Get most recent corrections
-        feedback.sort(key=lambda x: x["timestamp"], reverse=True)
-        feedback = feedback[:max_examples]
+        feedback = heapq.nlargest(max_examples, feedback, key=itemgetter("timestamp"))
 
         examples = []
         for correction in feedback:
@@ -188,18 +230,80 @@ class FeedbackStore:
         logger.info(f"Exported {len(examples)} training examples to {output_file}")
 
     def _load_feedback(self) -> list[dict[str, Any]]:
-        """Load feedback from file."""
+        """
+        Load feedback from file.
+
+        The parsed list is kept in memory and only re-read when the file's
+        modification time or size changes. Callers share that list and must
+        not modify it.
+        """
         try:
-            with open(self.feedback_file) as f:
-                data: list[dict[str, Any]] = json.load(f)
-                return data
-        except (FileNotFoundError, json.JSONDecodeError):
+            stat = self.feedback_file.stat()
+        except FileNotFoundError:
             return []
 
+        if self._cached_feedback is None or self._cached_stat != (stat.st_mtime_ns, stat.st_size):
+            try:
+                with self.feedback_file.open(encoding="utf-8") as f:
+                    data = [self._parse_line(line, number) for number, line in enumerate(f, 1) if line.strip()]
+            except FileNotFoundError:
+                return []
+            self._cached_feedback = [record for record in data if record is not None]
+            self._cached_stat = (stat.st_mtime_ns, stat.st_size)
+
+        return self._cached_feedback
+
+    def _parse_line(self, line: str, number: int) -> dict[str, Any] | None:
+        """Parse one correction, or None (with a warning) if the line is not a JSON object."""
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed feedback on line {number} of {self.feedback_file}")
+            return None
+        if not isinstance(record, dict):
+            logger.warning(f"Skipping feedback on line {number} of {self.feedback_file}: not a JSON object")
+            return None
+        return record
+
+    def _append_feedback(self, records: list[dict[str, Any]]) -> None:
+        """Append corrections to the file, one JSON object per line."""
+        lines = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        with self.feedback_file.open("ab+") as f:
+            # A hand-edited file may lack the final newline
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = "\n" + lines
+            f.write(lines.encode())
+        # Re-read on next load: default=str means the file may not round-trip to these objects
+        self._cached_feedback = None
+
     def _save_feedback(self, feedback: list[dict[str, Any]]) -> None:
-        """Save feedback to file."""
-        with open(self.feedback_file, "w") as f:
-            json.dump(feedback, f, indent=2, default=str)
+        """Replace the file's contents with the given corrections."""
+        with self.feedback_file.open("w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, default=str) + "\n" for record in feedback)
+        self._cached_feedback = None
+
+    def _migrate_json_array(self, source: Path) -> None:
+        """Rewrite feedback stored as one JSON array into the JSON lines file."""
+        # Only the first non-whitespace byte is needed to tell the formats apart,
+        # so an already converted file is not read in full on every start
+        with source.open("rb") as f:
+            while (chunk := f.read(4096)) and not chunk.strip():
+                pass
+            if not chunk.lstrip().startswith(b"["):
+                return
+            f.seek(0)
+            content = f.read()
+
+        try:
+            feedback = json.loads(content)
+        except json.JSONDecodeError:
+            logger.warning(f"Could not convert {source} to JSON lines: not valid JSON")
+            return
+
+        self._save_feedback(feedback)
+        logger.info(f"Converted {len(feedback)} corrections from {source} to {self.feedback_file}")
 
     def count(self) -> int:
         """Get total number of corrections."""
@@ -1,5 +1,10 @@
 """Rule-based pattern matching for failure classification."""
 
+import logging
+import re
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
 
 # Pattern format: (regex_pattern, reasoning)
 # Patterns are case-insensitive
@@ -117,3 +122,93 @@ WORKFLOW_ENGINE_PATTERNS: list[tuple[str, str]] = [
     # KeyError in activity execution (common workflow engine issue)
     (r"KeyError.*not in index", "Missing key in activity data"),
 ]
+
+
+def compile_patterns(patterns: list[tuple[str, str]]) -> list[tuple[re.Pattern[str], str]]:
+    """Compile (regex_pattern, reasoning) pairs case-insensitively, keeping their order."""
+    return [(re.compile(pattern, re.IGNORECASE), reasoning) for pattern, reasoning in patterns]
+
+
+def compile_lowercase(pattern: str) -> re.Pattern[str]:
+    """
+    Compile pattern for searching text that was already lowercased.
+
+    Case-sensitive matching lets re use its fast literal search, which
+    IGNORECASE disables. Only exact for ASCII text: str.lower() and
+    re.IGNORECASE fold some non-ASCII letters differently.
+    """
+    if re.search(r"\\[A-Z]", pattern):
+        # Lowercasing would turn escapes such as \D or \S into \d or \s
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern.lower())
+
+
+# Compiled once at import; the classifier matches against these
+INPUT_DATA_RULES = compile_patterns(INPUT_DATA_PATTERNS)
+THIRD_PARTY_RULES = compile_patterns(THIRD_PARTY_PATTERNS)
+WORKFLOW_ENGINE_RULES = compile_patterns(WORKFLOW_ENGINE_PATTERNS)
+
+
+_REGEX_METACHARACTERS = frozenset("\\.^$*+?{}[]|()")
+
+
+def required_literal(pattern: str) -> str | None:
+    """
+    Longest literal substring every match of pattern must contain, lowercased.
+
+    Only patterns made of literal runs joined by ".*" are handled, e.g.
+    "status.*code.*[4-5]\\d{2}" -> "status".
+
+    Returns:
+        The literal, or None if the pattern has no such run (or uses alternation)
+    """
+    if "|" in pattern:
+        return None
+    runs = [run for run in pattern.split(".*") if run and not _REGEX_METACHARACTERS.intersection(run)]
+    return max(runs, key=len).lower() if runs else None
+
+
+try:
+    import hyperscan
+
+    _HAS_HYPERSCAN = True
+except ImportError:  # hyperscan is an optional speedup (pip install ds-job-insights[fast])
+    _HAS_HYPERSCAN = False
+
+
+def build_scanner(patterns: list[str]) -> Callable[[str], int | None] | None:
+    """
+    Compile patterns into a single hyperscan database.
+
+    All patterns are tried in one pass over the text instead of one each.
+    Matching is case-insensitive ASCII only: re also folds characters such as
+    "İ" or the Kelvin sign onto ASCII letters, so non-ASCII text must be matched
+    with the compiled re patterns to get the same results.
+
+    Returns:
+        Function returning the index of the first pattern (in list order) that
+        matches an ASCII text, or None when no pattern does. None instead of a
+        function if hyperscan is not installed or cannot compile the patterns.
+    """
+    if not _HAS_HYPERSCAN or not patterns:
+        return None
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error as e:
+        logger.warning(f"Could not compile rule patterns with hyperscan, using re: {e}")
+        return None
+
+    def scan(text: str) -> int | None:
+        matched: list[int] = []
+        database.scan(text.encode("ascii"), match_event_handler=lambda index, *_: matched.append(index))
+        return min(matched) if matched else None
+
+    return scan
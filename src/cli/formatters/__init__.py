@@ -1,6 +1,6 @@
 """Output formatters for analysis results."""
 
-from typing import Type
+from functools import lru_cache
 
 from cli.formatters.base import Formatter
 from cli.formatters.csv import CSVFormatter
@@ -15,17 +15,23 @@ __all__ = [
 ]
 
 
+_FORMATTERS: dict[str, type[Formatter]] = {
+    "text": TextFormatter,
+    "json": JSONFormatter,
+    "csv": CSVFormatter,
+}
+
+
 def get_formatter(format_type: str) -> Formatter:
     """Factory function to get the appropriate formatter."""
-    formatters: dict[str, type[Formatter]] = {
-        "text": TextFormatter,
-        "json": JSONFormatter,
-        "csv": CSVFormatter,
-    }
-
-    formatter_class = formatters.get(format_type.lower())
-    if not formatter_class:
+    key = format_type.lower()
+    if key not in _FORMATTERS:
         raise ValueError(f"Unknown format: {format_type}")
 
-    return formatter_class()
+    return _shared_formatter(key)
+
 
+@lru_cache(maxsize=len(_FORMATTERS))
+def _shared_formatter(format_type: str) -> Formatter:
+    """One instance per format; formatters hold no state, so callers can share it."""
+    return _FORMATTERS[format_type]()
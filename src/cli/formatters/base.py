@@ -32,7 +32,7 @@ class Formatter(ABC):
 
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content)
+            output_path.write_text(content, encoding="utf-8")
         else:
             print(content)
 
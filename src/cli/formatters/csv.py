@@ -2,11 +2,17 @@
 
 import csv
 import io
+import sys
+from collections.abc import Iterator
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from cli.formatters.base import Formatter
 
+# Shared default for missing original_error dicts (read-only, never mutate)
+_EMPTY: dict[str, Any] = {}
+
 
 class CSVFormatter(Formatter):
     """Format analysis results as CSV."""
@@ -29,6 +35,11 @@ class CSVFormatter(Formatter):
     def format(self, summary: dict[str, Any]) -> str:
         """Format summary as CSV."""
         output = io.StringIO()
+        self._write_all(output, summary)
+        return output.getvalue()
+
+    def _write_all(self, output: TextIO, summary: dict[str, Any]) -> None:
+        """Write the header and every result's rows to output."""
         writer = csv.writer(output)
 
         # Write header
@@ -36,20 +47,19 @@ class CSVFormatter(Formatter):
 
         # Write data rows
         results = summary.get("results", [])
-        for result in results:
-            self._write_result_rows(writer, result)
+        writer.writerows(chain.from_iterable(map(self._result_rows, results)))
 
-        return output.getvalue()
-
-    def _write_result_rows(self, writer: Any, result: dict[str, Any]) -> None:
-        """Write CSV rows for a single job result."""
+    @staticmethod
+    def _result_rows(result: dict[str, Any]) -> Iterator[tuple[Any, ...]]:
+        """Yield one CSV row per error classification in a job result."""
         job_id = result["job_id"]
         pipeline = result.get("pipeline_name", "Unknown")
         tenant_id = result.get("tenant_id", "Unknown")
         finished_at = result.get("finished_at", "Unknown")
 
-        for classification in result.get("classifications", []):
-            writer.writerow([
+        for classification in result.get("classifications", ()):
+            error = classification.get("original_error") or _EMPTY
+            yield (
                 job_id,
                 pipeline,
                 tenant_id,
@@ -59,22 +69,16 @@ class CSVFormatter(Formatter):
                 classification.get("classified_by", "unknown"),
                 classification.get("confidence", 0.0),
                 classification.get("reasoning", "N/A"),
-                classification.get("original_error", {}).get("code", ""),
-                classification.get("original_error", {}).get("message", "No message"),
-                classification.get("original_error", {}).get("exception", "N/A"),
-            ])
+                error.get("code", ""),
+                error.get("message", "No message"),
+                error.get("exception", "N/A"),
+            )
 
     def write(self, summary: dict[str, Any], output_path: Path | None = None) -> None:
-        """Write CSV output with proper file handling."""
+        """Write CSV output row by row to a file or stdout, without building it in memory first."""
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(self.HEADERS)
-
-                results = summary.get("results", [])
-                for result in results:
-                    self._write_result_rows(writer, result)
+            with output_path.open("w", newline="", encoding="utf-8") as f:
+                self._write_all(f, summary)
         else:
-            print(self.format(summary))
-
+            self._write_all(sys.stdout, summary)
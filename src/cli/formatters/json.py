@@ -5,11 +5,25 @@ from typing import Any
 
 from cli.formatters.base import Formatter
 
+try:
+    import orjson
+
+    def _dumps(summary: dict[str, Any]) -> str:
+        """Serialize to indented JSON using orjson."""
+        # Pass datetimes and dataclasses to default=str so they render like the stdlib path
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(summary, option=option, default=str).decode()
+
+except ImportError:  # orjson is an optional speedup (pip install ds-job-insights[fast])
+
+    def _dumps(summary: dict[str, Any]) -> str:
+        """Serialize to indented JSON using the standard library."""
+        return json.dumps(summary, indent=2, default=str)
+
 
 class JSONFormatter(Formatter):
     """Format analysis results as JSON."""
 
     def format(self, summary: dict[str, Any]) -> str:
         """Format summary as pretty-printed JSON."""
-        return json.dumps(summary, indent=2, default=str)
-
+        return _dumps(summary)
@@ -1,95 +1,128 @@
 """Plain text output formatter."""
 
+import heapq
+import sys
+from collections.abc import Iterator
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
 from cli.formatters.base import Formatter
 
+# Section rules, built once (the _LINE variants end in a newline)
+_SEP80_LINE = "=" * 80 + "\n"
+_DASH80_LINE = "-" * 80 + "\n"
+_DASH140_LINE = "-" * 140 + "\n"
+
+# Shared default for missing original_error dicts (read-only, never mutate)
+_EMPTY: dict[str, Any] = {}
+
+# Row template for the detailed error table (job, pipeline, activity, category, by, error)
+_ERROR_ROW = "%-10s %-25s %-20s %-20s %-6s %-40s\n"
+
 
 class TextFormatter(Formatter):
     """Format analysis results as plain text."""
 
     def format(self, summary: dict[str, Any]) -> str:
         """Format summary as plain text with nice formatting."""
-        lines = []
+        return "".join(self.iter_format(summary))
+
+    def write(self, summary: dict[str, Any], output_path: Path | None = None) -> None:
+        """Write the report chunk by chunk to a file or stdout, without building it in memory first."""
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with output_path.open("w", encoding="utf-8") as f:
+                f.writelines(self.iter_format(summary))
+        else:
+            sys.stdout.writelines(self.iter_format(summary))
+            sys.stdout.write("\n")  # Trailing newline, as print() gave
 
+    def iter_format(self, summary: dict[str, Any]) -> Iterator[str]:
+        """Yield the plain text report line by line (each ending in a newline)."""
         # Header
-        lines.append("=" * 80)
-        lines.append("FAILURE ANALYSIS SUMMARY")
-        lines.append("=" * 80)
-        lines.append(f"\nAnalysis Period: {summary['period_start']} to {summary['period_end']}")
-        lines.append(f"Analyzed At: {summary['analyzed_at']}")
-        lines.append(f"\nTotal Failed Jobs: {summary['total_jobs']}")
-        lines.append(f"Total Errors: {summary['total_errors']}")
+        yield _SEP80_LINE
+        yield "FAILURE ANALYSIS SUMMARY\n"
+        yield _SEP80_LINE
+        yield f"\nAnalysis Period: {summary['period_start']} to {summary['period_end']}\n"
+        yield f"Analyzed At: {summary['analyzed_at']}\n"
+        yield f"\nTotal Failed Jobs: {summary['total_jobs']}\n"
+        yield f"Total Errors: {summary['total_errors']}\n"
+        if summary.get("skipped_count"):
+            yield f"Skipped Jobs: {summary['skipped_count']} (could not be analyzed, see logs)\n"
 
         # Category breakdown
-        lines.append("\n" + "-" * 80)
-        lines.append("ERRORS BY CATEGORY")
-        lines.append("-" * 80)
+        yield "\n" + _DASH80_LINE
+        yield "ERRORS BY CATEGORY\n"
+        yield _DASH80_LINE
 
         by_category = summary.get("by_category", {})
         if by_category:
-            for category, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
-                percentage = (count / summary["total_errors"] * 100) if summary["total_errors"] > 0 else 0
-                lines.append(f"  {category:25s}: {count:4d} ({percentage:5.1f}%)")
+            total = summary["total_errors"]
+            # No reciprocal multiply: count * (100 / total) rounds differently at some .x5 boundaries
+            for category, count in sorted(by_category.items(), key=itemgetter(1), reverse=True):
+                percentage = count / total * 100 if total > 0 else 0
+                yield f"  {category:25s}: {count:4d} ({percentage:5.1f}%)\n"
         else:
-            lines.append("  No errors found")
+            yield "  No errors found\n"
 
         # Tenant breakdown
-        lines.append("\n" + "-" * 80)
-        lines.append("FAILED JOBS BY TENANT")
-        lines.append("-" * 80)
+        yield "\n" + _DASH80_LINE
+        yield "FAILED JOBS BY TENANT\n"
+        yield _DASH80_LINE
 
         by_tenant = summary.get("by_tenant", {})
         if by_tenant:
-            for tenant_id, count in sorted(by_tenant.items(), key=lambda x: x[1], reverse=True):
-                lines.append(f"  {tenant_id}: {count} jobs")
+            for tenant_id, count in sorted(by_tenant.items(), key=itemgetter(1), reverse=True):
+                yield f"  {tenant_id}: {count} jobs\n"
         else:
-            lines.append("  No tenants found")
+            yield "  No tenants found\n"
 
         # Pipeline breakdown
-        lines.append("\n" + "-" * 80)
-        lines.append("FAILED JOBS BY PIPELINE")
-        lines.append("-" * 80)
+        yield "\n" + _DASH80_LINE
+        yield "FAILED JOBS BY PIPELINE\n"
+        yield _DASH80_LINE
 
         by_pipeline = summary.get("by_pipeline", {})
         if by_pipeline:
-            for pipeline, count in sorted(by_pipeline.items(), key=lambda x: x[1], reverse=True)[:10]:
-                lines.append(f"  {pipeline}: {count} jobs")
+            for pipeline, count in heapq.nlargest(10, by_pipeline.items(), key=itemgetter(1)):
+                yield f"  {pipeline}: {count} jobs\n"
             if len(by_pipeline) > 10:
-                lines.append(f"  ... and {len(by_pipeline) - 10} more pipelines")
+                yield f"  ... and {len(by_pipeline) - 10} more pipelines\n"
         else:
-            lines.append("  No pipelines found")
+            yield "  No pipelines found\n"
 
         # Detailed error table
-        lines.append("\n" + "-" * 80)
-        lines.append("ALL ERRORS - DETAILED BREAKDOWN")
-        lines.append("-" * 80)
+        yield "\n" + _DASH80_LINE
+        yield "ALL ERRORS - DETAILED BREAKDOWN\n"
+        yield _DASH80_LINE
 
         results = summary.get("results", [])
         if results:
             # Header
-            lines.append(f"\n{'Job ID':<10} {'Pipeline':<25} {'Activity':<20} {'Category':<20} {'By':<6} {'Error':<40}")
-            lines.append("-" * 140)
+            yield "\n" + _ERROR_ROW % ("Job ID", "Pipeline", "Activity", "Category", "By", "Error")
+            yield _DASH140_LINE
 
+            total_errors = 0
             for result in results:
                 job_id = result["job_id"][:8]
                 pipeline = result.get("pipeline_name", "Unknown")[:24]
 
                 # Show each error classification
                 for classification in result.get("classifications", []):
-                    activity = classification.get("activity_name", "N/A")[:19]
-                    category = classification.get("category", "UNKNOWN")[:19]
-                    classified_by = classification.get("classified_by", "unk")[:5]
-                    error_msg = classification.get("original_error", {}).get("message", "No message")[:39]
-
-                    lines.append(f"{job_id:<10} {pipeline:<25} {activity:<20} {category:<20} {classified_by:<6} {error_msg:<40}")
-
-            total_errors = sum(len(r.get("classifications", [])) for r in results)
-            lines.append(f"\nTotal: {total_errors} errors across {len(results)} jobs")
+                    total_errors += 1
+                    yield _ERROR_ROW % (
+                        job_id,
+                        pipeline,
+                        classification.get("activity_name", "N/A")[:19],
+                        classification.get("category", "UNKNOWN")[:19],
+                        classification.get("classified_by", "unk")[:5],
+                        classification.get("original_error", _EMPTY).get("message", "No message")[:39],
+                    )
+
+            yield f"\nTotal: {total_errors} errors across {len(results)} jobs\n"
         else:
-            lines.append("  No errors found")
-
-        lines.append("\n" + "=" * 80 + "\n")
+            yield "  No errors found\n"
 
-        return "\n".join(lines)
+        yield "\n" + _SEP80_LINE
 
@@ -7,12 +7,44 @@ import json
 import logging
 import os
 import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 from uuid import UUID
 
-from analyzer import FailureAnalyzerJob
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to indented JSON using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+except ImportError:  # orjson is an optional speedup (pip install ds-job-insights[fast])
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to indented JSON using the standard library."""
+        return json.dumps(obj, indent=2, default=str)
+
+if TYPE_CHECKING:
+    from analyzer.job import AnalysisResult, AnalysisSummary
+
+
+# Write buffer for CSV file exports, sized so large reports flush in few syscalls
+OUTPUT_BUFFER_SIZE = 128 * 1024
+
+# Shared default for missing original_error dicts (read-only, never mutate)
+_EMPTY: dict[str, Any] = {}
+
+# Row template for the markdown detailed error table
+_MD_ERROR_ROW = "| %s | %s | %s | %s | %s | %s | %s |"
+
+
+def _fit(value: str | None, limit: int, width: int) -> str:
+    """Truncate a value to limit characters and left-justify it to width."""
+    return (value or "")[:limit].ljust(width)
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -25,161 +57,207 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def print_markdown_summary(summary: dict[str, Any]) -> None:
-    """Print analysis summary in Markdown format."""
-    print("# Failure Analysis Report")
-    print()
-    print(f"**Analysis Period:** {summary['period_start']} to {summary['period_end']}  ")
-    print(f"**Analyzed At:** {summary['analyzed_at']}  ")
-    print()
-    print("## Summary")
-    print()
-    print(f"- **Total Failed Jobs:** {summary['total_jobs']}")
-    print(f"- **Total Errors:** {summary['total_errors']}")
-    print()
+def render_markdown_summary(summary: "AnalysisSummary") -> str:
+    """Render analysis summary as a Markdown report."""
+    out: list[str] = []
+
+    out.append("# Failure Analysis Report")
+    out.append("")
+    out.append(f"**Analysis Period:** {summary.period_start.isoformat()} to {summary.period_end.isoformat()}  ")
+    out.append(f"**Analyzed At:** {summary.analyzed_at.isoformat()}  ")
+    out.append("")
+    out.append("## Summary")
+    out.append("")
+    out.append(f"- **Total Failed Jobs:** {summary.total_jobs}")
+    out.append(f"- **Total Errors:** {summary.total_errors}")
+    if summary.skipped_count:
+        out.append(f"- **Skipped Jobs:** {summary.skipped_count}")
+    out.append("")
 
     # Category breakdown
-    print("## Errors by Category")
-    print()
-    by_category = summary.get("by_category", {})
+    out.append("## Errors by Category")
+    out.append("")
+    by_category = Counter(summary.by_category)
     if by_category:
-        print("| Category | Count | Percentage |")
-        print("|----------|-------|------------|")
-        for category, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / summary["total_errors"] * 100) if summary["total_errors"] > 0 else 0
-            print(f"| {category} | {count} | {percentage:.1f}% |")
+        out.append("| Category | Count | Percentage |")
+        out.append("|----------|-------|------------|")
+        total_errors = summary.total_errors
+        for category, count in by_category.most_common():
+            percentage = (count / total_errors * 100) if total_errors > 0 else 0
+            out.append(f"| {category} | {count} | {percentage:.1f}% |")
     else:
-        print("*No errors found*")
-    print()
+        out.append("*No errors found*")
+    out.append("")
 
     # Tenant breakdown
-    print("## Failed Jobs by Tenant")
-    print()
-    by_tenant = summary.get("by_tenant", {})
+    out.append("## Failed Jobs by Tenant")
+    out.append("")
+    by_tenant = Counter(summary.by_tenant)
     if by_tenant:
-        print("| Tenant ID | Failed Jobs |")
-        print("|-----------|-------------|")
-        for tenant_id, count in sorted(by_tenant.items(), key=lambda x: x[1], reverse=True):
-            print(f"| `{tenant_id}` | {count} |")
+        out.append("| Tenant ID | Failed Jobs |")
+        out.append("|-----------|-------------|")
+        for tenant_id, count in by_tenant.most_common():
+            out.append(f"| `{tenant_id}` | {count} |")
     else:
-        print("*No tenant data*")
-    print()
+        out.append("*No tenant data*")
+    out.append("")
 
     # Pipeline breakdown
-    print("## Failed Jobs by Pipeline")
-    print()
-    by_pipeline = summary.get("by_pipeline", {})
+    out.append("## Failed Jobs by Pipeline")
+    out.append("")
+    by_pipeline = Counter(summary.by_pipeline)
     if by_pipeline:
-        print("| Pipeline | Failed Jobs |")
-        print("|----------|-------------|")
+        out.append("| Pipeline | Failed Jobs |")
+        out.append("|----------|-------------|")
         # Show top 20 pipelines
-        for pipeline, count in sorted(by_pipeline.items(), key=lambda x: x[1], reverse=True)[:20]:
-            print(f"| {pipeline} | {count} |")
+        for pipeline, count in by_pipeline.most_common(20):
+            out.append(f"| {pipeline} | {count} |")
 
         remaining = len(by_pipeline) - 20
         if remaining > 0:
-            print(f"| *...and {remaining} more pipelines* | |")
+            out.append(f"| *...and {remaining} more pipelines* | |")
     else:
-        print("*No pipeline data*")
-    print()
+        out.append("*No pipeline data*")
+    out.append("")
 
     # Detailed error table
-    print("## All Errors - Detailed Breakdown")
-    print()
-    print("| Job ID | Pipeline | Activity | Category | Classified By | Error Message | Finished At |")
-    print("|--------|----------|----------|----------|---------------|---------------|-------------|")
+    out.append("## All Errors - Detailed Breakdown")
+    out.append("")
+    out.append("| Job ID | Pipeline | Activity | Category | Classified By | Error Message | Finished At |")
+    out.append("|--------|----------|----------|----------|---------------|---------------|-------------|")
 
-    results = summary.get("results", [])
+    results = summary.results
     if results:
         for result in results:
-            job_id = result["job_id"][:8]  # Shortened for readability
-            pipeline = result.get("pipeline_name", "Unknown")[:30]  # Truncate long names
-            finished_at = result.get("finished_at", "Unknown")[:19] if result.get("finished_at") else "Unknown"
+            job_id = result.job_id[:8]  # Shortened for readability
+            pipeline = (result.pipeline_name or "Unknown")[:30]  # Truncate long names
+            finished_at = result.finished_at.isoformat()[:19] if result.finished_at else "Unknown"
 
             # Show each error classification
-            for classification in result.get("classifications", []):
-                activity = classification.get("activity_name", "N/A")[:25]
-                category = classification.get("category", "UNKNOWN")
-                classified_by = classification.get("classified_by", "unknown")
-                error_msg = classification.get("original_error", {}).get("message", "No message")[:50]
-
-                print(f"| {job_id} | {pipeline} | {activity} | {category} | {classified_by} | {error_msg} | {finished_at} |")
+            for classification in result.classifications:
+                activity = (classification.activity_name or "N/A")[:25]
+                category = classification.category
+                classified_by = classification.classified_by
+                error = classification.original_error or _EMPTY
+                error_msg = error.get("message", "No message")[:50]
+
+                out.append(_MD_ERROR_ROW % (job_id, pipeline, activity, category, classified_by, error_msg, finished_at))
     else:
-        print("| - | - | - | - | - | - | - |")
-    print()
+        out.append("| - | - | - | - | - | - | - |")
+    out.append("")
 
     # Detailed error breakdown by category
-    print("## Detailed Error Analysis by Category")
-    print()
+    out.append("## Detailed Error Analysis by Category")
+    out.append("")
 
     if results:
-        # Group by category
-        by_cat: dict[str, list[dict[str, Any]]] = {}
+        # Group by category, keeping only the 10 jobs shown per category
+        by_cat: dict[str, list[AnalysisResult]] = defaultdict(list)
+        cat_counts: Counter[str] = Counter()
         for result in results:
-            cat = result.get("primary_category", "UNKNOWN")
-            if cat not in by_cat:
-                by_cat[cat] = []
-            by_cat[cat].append(result)
+            cat = result.primary_category or "UNKNOWN"
+            cat_counts[cat] += 1
+            if cat_counts[cat] <= 10:
+                by_cat[cat].append(result)
+
+        # Known categories in their declared order, then anything else as first seen
+        from classifier.categories import FailureCategory
 
-        for category in sorted(by_cat.keys()):
+        ordered: list[str] = [c for c in FailureCategory if c in by_cat]
+        ordered += [c for c in by_cat if c not in FailureCategory]
+
+        for category in ordered:
             errors = by_cat[category]
-            print(f"### {category} ({len(errors)} jobs)")
-            print()
+            job_count = cat_counts[category]
+            out.append(f"### {category} ({job_count} jobs)")
+            out.append("")
 
             # Show top 10 errors for this category
-            for result in errors[:10]:
-                print(f"#### Job: `{result['job_id']}`")
-                print()
-                print(f"- **Pipeline:** {result.get('pipeline_name', 'Unknown')}")
-                print(f"- **Finished At:** {result.get('finished_at', 'Unknown')}")
-                print(f"- **Total Errors:** {result.get('total_errors', 0)}")
-                print()
+            for result in errors:
+                finished = result.finished_at.isoformat() if result.finished_at else "Unknown"
+                out.append(f"#### Job: `{result.job_id}`")
+                out.append("")
+                out.append(f"- **Pipeline:** {result.pipeline_name or 'Unknown'}")
+                out.append(f"- **Finished At:** {finished}")
+                out.append(f"- **Total Errors:** {result.total_errors}")
+                out.append("")
 
                 # Show classifications
-                classifications = result.get("classifications", [])
+                classifications = result.classifications
                 if classifications:
-                    print("**Errors:**")
-                    print()
+                    out.append("**Errors:**")
+                    out.append("")
                     for i, cls in enumerate(classifications[:3], 1):  # Show max 3 errors per job
-                        print(f"{i}. **{cls.get('activity_name', 'Unknown')}**")
-                        print(f"   - Category: `{cls.get('category', 'UNKNOWN')}`")
-                        print(f"   - Confidence: {cls.get('confidence', 0):.2f}")
-                        print(f"   - Reasoning: {cls.get('reasoning', 'N/A')}")
+                        out.append(f"{i}. **{cls.activity_name or 'Unknown'}**")
+                        out.append(f"   - Category: `{cls.category}`")
+                        out.append(f"   - Confidence: {cls.confidence:.2f}")
+                        out.append(f"   - Reasoning: {cls.reasoning}")
 
-                        error = cls.get("original_error", {})
+                        error = cls.original_error or _EMPTY
                         if error:
-                            print(f"   - Exception: `{error.get('exception', 'Unknown')}`")
-                            print(f"   - Message: {error.get('message', 'N/A')}")
-                        print()
+                            out.append(f"   - Exception: `{error.get('exception', 'Unknown')}`")
+                            out.append(f"   - Message: {error.get('message', 'N/A')}")
+                        out.append("")
 
                     if len(classifications) > 3:
-                        print(f"   *...and {len(classifications) - 3} more errors*")
-                        print()
-                print()
+                        out.append(f"   *...and {len(classifications) - 3} more errors*")
+                        out.append("")
+                out.append("")
 
-            if len(errors) > 10:
-                print(f"*...and {len(errors) - 10} more jobs in this category*")
-                print()
+            if job_count > 10:
+                out.append(f"*...and {job_count - 10} more jobs in this category*")
+                out.append("")
     else:
-        print("*No detailed results available*")
-    print()
+        out.append("*No detailed results available*")
+    out.append("")
 
     # Footer
-    print("---")
-    print()
-    print("*Generated by ds-job-insights*")
+    out.append("---")
+    out.append("")
+    out.append("*Generated by ds-job-insights*")
+
+    # Trailing "" gives the final newline without copying the joined report
+    out.append("")
+    return "\n".join(out)
+
+
+def print_markdown_summary(summary: "AnalysisSummary") -> None:
+    """Print analysis summary in Markdown format."""
+    sys.stdout.write(render_markdown_summary(summary))
+
+
+def _csv_rows_for(result: dict[str, Any]) -> Iterator[tuple[Any, ...]]:
+    """Yield one CSV row per error classification in a job result."""
+    job_id = result["job_id"]
+    pipeline = result.get("pipeline_name", "Unknown")
+    tenant_id = result.get("tenant_id", "Unknown")
+    finished_at = result.get("finished_at", "Unknown")
+
+    for classification in result.get("classifications", ()):
+        error = classification.get("original_error") or _EMPTY
+        yield (
+            job_id,
+            pipeline,
+            tenant_id,
+            finished_at,
+            classification.get("activity_name", "N/A"),
+            classification.get("category", "UNKNOWN"),
+            classification.get("classified_by", "unknown"),
+            classification.get("confidence", 0.0),
+            classification.get("reasoning", "N/A"),
+            error.get("code", ""),
+            error.get("message", "No message"),
+            error.get("exception", "N/A"),
+        )
 
 
 def export_csv(summary: dict[str, Any], output_file: Path | None = None) -> None:
     """Export detailed error data to CSV format."""
-    import io
-    from typing import TextIO
-
     output: TextIO
     if output_file is None:
-        output = io.StringIO()
+        output = sys.stdout
     else:
-        output = open(output_file, "w", newline="")
+        output = open(output_file, "w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_SIZE)
 
     try:
         writer = csv.writer(output)
@@ -201,52 +279,22 @@ def export_csv(summary: dict[str, Any], output_file: Path | None = None) -> None
         ])
 
         # Data rows
-        results = summary.get("results", [])
-        for result in results:
-            job_id = result["job_id"]
-            pipeline = result.get("pipeline_name", "Unknown")
-            tenant_id = result.get("tenant_id", "Unknown")
-            finished_at = result.get("finished_at", "Unknown")
-
-            for classification in result.get("classifications", []):
-                activity = classification.get("activity_name", "N/A")
-                category = classification.get("category", "UNKNOWN")
-                classified_by = classification.get("classified_by", "unknown")
-                confidence = classification.get("confidence", 0.0)
-                reasoning = classification.get("reasoning", "N/A")
-
-                error = classification.get("original_error", {})
-                error_code = error.get("code", "")
-                error_msg = error.get("message", "No message")
-                exception = error.get("exception", "N/A")
-
-                writer.writerow([
-                    job_id,
-                    pipeline,
-                    tenant_id,
-                    finished_at,
-                    activity,
-                    category,
-                    classified_by,
-                    confidence,
-                    reasoning,
-                    error_code,
-                    error_msg,
-                    exception
-                ])
-
-        if output_file is None and isinstance(output, io.StringIO):
-            print(output.getvalue())
+        writer.writerows(chain.from_iterable(map(_csv_rows_for, summary.get("results", []))))
 
     finally:
         if output_file is not None:
             output.close()
 
 
-def print_summary(summary: dict[str, Any], format: str = "text") -> None:
-    """Print analysis summary in the specified format."""
+def print_summary(summary: "AnalysisSummary", format: str = "text") -> None:
+    """
+    Print analysis summary in the specified format.
+
+    Text and markdown read the summary's attributes directly; only json and
+    csv go through to_dict().
+    """
     if format == "json":
-        print(json.dumps(summary, indent=2, default=str))
+        print(_json_dumps(summary.to_dict()))
         return
 
     if format == "markdown":
@@ -254,82 +302,97 @@ def print_summary(summary: dict[str, Any], format: str = "text") -> None:
         return
 
     if format == "csv":
-        export_csv(summary)
+        export_csv(summary.to_dict())
         return
 
+    sys.stdout.write(render_text_summary(summary))
+
+
+def render_text_summary(summary: "AnalysisSummary") -> str:
+    """Render analysis summary as a plain text report."""
     # Text format with nice formatting
-    print("\n" + "=" * 80)
-    print("FAILURE ANALYSIS SUMMARY")
-    print("=" * 80)
-    print(f"\nAnalysis Period: {summary['period_start']} to {summary['period_end']}")
-    print(f"Analyzed At: {summary['analyzed_at']}")
-    print(f"\nTotal Failed Jobs: {summary['total_jobs']}")
-    print(f"Total Errors: {summary['total_errors']}")
+    out: list[str] = []
+    out.append("\n" + "=" * 80)
+    out.append("FAILURE ANALYSIS SUMMARY")
+    out.append("=" * 80)
+    out.append(f"\nAnalysis Period: {summary.period_start.isoformat()} to {summary.period_end.isoformat()}")
+    out.append(f"Analyzed At: {summary.analyzed_at.isoformat()}")
+    out.append(f"\nTotal Failed Jobs: {summary.total_jobs}")
+    out.append(f"Total Errors: {summary.total_errors}")
+    if summary.skipped_count:
+        out.append(f"Skipped Jobs: {summary.skipped_count} (could not be analyzed, see logs)")
 
     # Category breakdown
-    print("\n" + "-" * 80)
-    print("ERRORS BY CATEGORY")
-    print("-" * 80)
-    by_category = summary.get("by_category", {})
+    out.append("\n" + "-" * 80)
+    out.append("ERRORS BY CATEGORY")
+    out.append("-" * 80)
+    by_category = Counter(summary.by_category)
     if by_category:
-        for category, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / summary["total_errors"] * 100) if summary["total_errors"] > 0 else 0
-            print(f"  {category:25s}: {count:4d} ({percentage:5.1f}%)")
+        total_errors = summary.total_errors
+        for category, count in by_category.most_common():
+            percentage = (count / total_errors * 100) if total_errors > 0 else 0
+            out.append(f"  {category:25s}: {count:4d} ({percentage:5.1f}%)")
     else:
-        print("  No errors found")
+        out.append("  No errors found")
 
     # Tenant breakdown
-    print("\n" + "-" * 80)
-    print("FAILED JOBS BY TENANT")
-    print("-" * 80)
-    by_tenant = summary.get("by_tenant", {})
+    out.append("\n" + "-" * 80)
+    out.append("FAILED JOBS BY TENANT")
+    out.append("-" * 80)
+    by_tenant = Counter(summary.by_tenant)
     if by_tenant:
-        for tenant_id, count in sorted(by_tenant.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {tenant_id}: {count} jobs")
+        for tenant_id, count in by_tenant.most_common():
+            out.append(f"  {tenant_id}: {count} jobs")
     else:
-        print("  No tenants found")
+        out.append("  No tenants found")
 
     # Pipeline breakdown
-    print("\n" + "-" * 80)
-    print("FAILED JOBS BY PIPELINE")
-    print("-" * 80)
-    by_pipeline = summary.get("by_pipeline", {})
+    out.append("\n" + "-" * 80)
+    out.append("FAILED JOBS BY PIPELINE")
+    out.append("-" * 80)
+    by_pipeline = Counter(summary.by_pipeline)
     if by_pipeline:
-        for pipeline, count in sorted(by_pipeline.items(), key=lambda x: x[1], reverse=True)[:10]:
-            print(f"  {pipeline}: {count} jobs")
+        for pipeline, count in by_pipeline.most_common(10):
+            out.append(f"  {pipeline}: {count} jobs")
         if len(by_pipeline) > 10:
-            print(f"  ... and {len(by_pipeline) - 10} more pipelines")
+            out.append(f"  ... and {len(by_pipeline) - 10} more pipelines")
     else:
-        print("  No pipelines found")
+        out.append("  No pipelines found")
 
     # Detailed error table
-    print("\n" + "-" * 80)
-    print("ALL ERRORS - DETAILED BREAKDOWN")
-    print("-" * 80)
-    results = summary.get("results", [])
+    out.append("\n" + "-" * 80)
+    out.append("ALL ERRORS - DETAILED BREAKDOWN")
+    out.append("-" * 80)
+    results = summary.results
     if results:
         # Header
-        print(f"\n{'Job ID':<10} {'Pipeline':<25} {'Activity':<20} {'Category':<20} {'By':<6} {'Error':<40}")
-        print("-" * 140)
+        out.append(f"\n{'Job ID':<10} {'Pipeline':<25} {'Activity':<20} {'Category':<20} {'By':<6} {'Error':<40}")
+        out.append("-" * 140)
 
         for result in results:
-            job_id = result["job_id"][:8]
-            pipeline = result.get("pipeline_name", "Unknown")[:24]
+            # Job columns are the same for every row of this result
+            job_cols = f"{_fit(result.job_id, 8, 10)} {_fit(result.pipeline_name or 'Unknown', 24, 25)}"
 
             # Show each error classification
-            for classification in result.get("classifications", []):
-                activity = classification.get("activity_name", "N/A")[:19]
-                category = classification.get("category", "UNKNOWN")[:19]
-                classified_by = classification.get("classified_by", "unk")[:5]
-                error_msg = classification.get("original_error", {}).get("message", "No message")[:39]
-
-                print(f"{job_id:<10} {pipeline:<25} {activity:<20} {category:<20} {classified_by:<6} {error_msg:<40}")
-
-        print(f"\nTotal: {sum(len(r.get('classifications', [])) for r in results)} errors across {len(results)} jobs")
+            for classification in result.classifications:
+                error = classification.original_error or _EMPTY
+                out.append(
+                    f"{job_cols} "
+                    f"{_fit(classification.activity_name or 'N/A', 19, 20)} "
+                    f"{_fit(classification.category, 19, 20)} "
+                    f"{_fit(classification.classified_by, 5, 6)} "
+                    f"{_fit(error.get('message', 'No message'), 39, 40)}"
+                )
+
+        out.append(f"\nTotal: {sum(len(r.classifications) for r in results)} errors across {len(results)} jobs")
     else:
-        print("  No errors found")
+        out.append("  No errors found")
 
-    print("\n" + "=" * 80 + "\n")
+    out.append("\n" + "=" * 80 + "\n")
+
+    # Trailing "" gives the final newline without copying the joined report
+    out.append("")
+    return "\n".join(out)
 
 
 def main() -> int:
@@ -397,6 +460,11 @@ Environment Variables:
         action="store_true",
         help="Disable LLM fallback (use rules only)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk cache of LLM classifications (always ask the LLM)",
+    )
     parser.add_argument(
         "--llm-model",
         type=str,
@@ -407,6 +475,12 @@ Environment Variables:
         type=str,
         help="LLM API URL (default: http://localhost:11434/v1 for Ollama)",
     )
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        default=4,
+        help="Max concurrent LLM requests (default: 4)",
+    )
     parser.add_argument(
         "--format",
         choices=["text", "json", "csv"],
@@ -442,12 +516,17 @@ Environment Variables:
         if args.llm_url:
             os.environ["LOCAL_LLM_BASE_URL"] = args.llm_url
 
+        # Deferred so --help and argument errors don't load the analyzer/db/LLM stack
+        from analyzer import FailureAnalyzerJob
+
         # Run analysis
         logger.info("Starting failure analysis...")
 
         job = FailureAnalyzerJob(
             use_llm=not args.no_llm,
             lookback_hours=args.hours,
+            use_cache=not args.no_cache,
+            max_workers=args.llm_workers,
         )
 
         summary = job.run(
@@ -456,27 +535,23 @@ Environment Variables:
             tenant_id=tenant_id,
         )
 
-        # Convert to dict
-        summary_dict = summary.to_dict()
-
         # Output results
         if args.output:
             args.output.parent.mkdir(parents=True, exist_ok=True)
             if args.format == "json":
-                with open(args.output, "w") as f:
-                    json.dump(summary_dict, f, indent=2, default=str)
+                args.output.write_text(_json_dumps(summary.to_dict()), encoding="utf-8")
             elif args.format == "csv":
-                export_csv(summary_dict, args.output)
+                export_csv(summary.to_dict(), args.output)
             else:
-                # Redirect stdout to file for text/markdown format
-                with open(args.output, "w") as f:
-                    old_stdout = sys.stdout
-                    sys.stdout = f
-                    print_summary(summary_dict, args.format)
-                    sys.stdout = old_stdout
+                # Render the whole report, then write it out in one go
+                if args.format == "markdown":
+                    rendered = render_markdown_summary(summary)
+                else:
+                    rendered = render_text_summary(summary)
+                args.output.write_bytes(rendered.encode("utf-8"))
             logger.info(f"Results saved to {args.output}")
         else:
-            print_summary(summary_dict, args.format)
+            print_summary(summary, args.format)
 
         return 0
 
@@ -5,15 +5,53 @@ import logging
 import os
 from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from typing import Any
 from uuid import UUID
 
-import boto3
-from sqlalchemy import create_engine, text
+from sqlalchemy import DateTime, Integer, String, bindparam, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 logger = logging.getLogger(__name__)
 
+# The failed-jobs query with and without the tenant filter, built once so
+# every call reuses the same statement objects. UUIDs are cast to text in
+# Postgres so rows already carry the strings the analyzer works with.
+_FAILED_JOBS_SQL = """
+    SELECT
+        je.id::text AS id,
+        je.pipeline_id::text AS pipeline_id,
+        je.session_id::text AS session_id,
+        je.tenant_id::text AS tenant_id,
+        je.status,
+        je.data->'run_info'->'errors' as errors,
+        je.started_at,
+        je.finished_at,
+        je.duration,
+        p.name as pipeline_name
+    FROM job_execution je
+    LEFT JOIN pipeline p ON je.pipeline_id = p.id
+    WHERE je.status = 'FAILURE'
+      AND je.finished_at >= :since
+      AND je.finished_at <= :until
+      AND je.data->'run_info'->'errors' IS NOT NULL
+      AND (je.data->'run_info'->'errors')::jsonb NOT IN ('null', '{}', '[]')
+"""
+_FAILED_JOBS_ORDER_SQL = """\
+    ORDER BY je.finished_at DESC
+    LIMIT :limit
+"""
+# Typed up front so bind processing is not inferred from the values on each call
+_FAILED_JOBS_PARAMS = (
+    bindparam("since", type_=DateTime(timezone=True)),
+    bindparam("until", type_=DateTime(timezone=True)),
+    bindparam("limit", type_=Integer),
+)
+_FAILED_JOBS_QUERY = text(_FAILED_JOBS_SQL + _FAILED_JOBS_ORDER_SQL).bindparams(*_FAILED_JOBS_PARAMS)
+_FAILED_JOBS_BY_TENANT_QUERY = text(
+    _FAILED_JOBS_SQL + "      AND je.tenant_id = :tenant_id\n" + _FAILED_JOBS_ORDER_SQL
+).bindparams(*_FAILED_JOBS_PARAMS, bindparam("tenant_id", type_=String))
+
 
 def get_db_uri() -> str:
     """
@@ -27,44 +65,68 @@ def get_db_uri() -> str:
     Returns:
         PostgreSQL connection URI
     """
+    env = os.environ
+
     # Option 1: Full URI from environment
-    if uri := os.environ.get("DATABASE_URI"):
+    if uri := env.get("DATABASE_URI"):
         logger.debug("Using DATABASE_URI from environment")
         return uri
 
     # Option 2: Build URI from individual components
-    if all(os.environ.get(k) for k in ["DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"]):
-        host = os.environ["DB_HOST"]
-        port = os.environ.get("DB_PORT", "5432")
-        name = os.environ["DB_NAME"]
-        user = os.environ["DB_USER"]
-        password = os.environ["DB_PASSWORD"]
+    host = env.get("DB_HOST")
+    name = env.get("DB_NAME")
+    user = env.get("DB_USER")
+    password = env.get("DB_PASSWORD")
+    if host and name and user and password:
+        port = env.get("DB_PORT", "5432")
         uri = f"postgresql://{user}:{password}@{host}:{port}/{name}"
         logger.debug(f"Built DATABASE_URI from components: {user}@{host}:{port}/{name}")
         return uri
 
     # Option 3: Fetch from SSM Parameter Store
-    building_mode = os.environ.get("BUILDING_MODE", "dev")
+    building_mode = env.get("BUILDING_MODE", "dev")
     parameter_name = f"/dsw/mgr/db_uri-{building_mode}"
 
     logger.debug(f"Fetching database URI from SSM: {parameter_name}")
-    ssm = boto3.client("ssm", region_name=os.environ.get("AWS_REGION", "eu-north-1"))
+    # Imported here since loading botocore is slow and only this path needs it
+    import boto3  # noqa: PLC0415
+
+    ssm = boto3.client("ssm", region_name=env.get("AWS_REGION", "eu-north-1"))
     response = ssm.get_parameter(Name=parameter_name, WithDecryption=True)
     value: str = response["Parameter"]["Value"]
     return value
 
 
-@contextlib.contextmanager
-def get_db_session() -> Generator[Session, None, None]:
-    """Create a database session context manager."""
-    engine = create_engine(get_db_uri())
-    session_factory = sessionmaker(
+@cache
+def _session_factory() -> sessionmaker[Session]:
+    """
+    Create the engine and session factory on first use.
+
+    The engine (and its connection pool) is reused by every later session,
+    so repeated analyses in one process, e.g. warm Lambda invocations, skip
+    resolving the URI and connecting to Postgres again.
+    """
+    # The driver's default json loader is kept on purpose: orjson turns integers
+    # beyond 64 bits into floats and rejects numbers outside the double range,
+    # both of which a jsonb errors value can hold
+    engine = create_engine(
+        get_db_uri(),
+        pool_size=5,
+        pool_pre_ping=True,  # Replace connections the server dropped while idle
+        pool_recycle=1800,
+    )
+    return sessionmaker(
         autocommit=False,
         autoflush=False,
         bind=engine,
         expire_on_commit=False,
     )
-    session = session_factory()
+
+
+@contextlib.contextmanager
+def get_db_session() -> Generator[Session, None, None]:
+    """Create a database session context manager."""
+    session = _session_factory()()
     try:
         yield session
         session.commit()
@@ -92,65 +154,45 @@ def get_failed_jobs(
         tenant_id: Optional tenant filter
         limit: Maximum number of results
 
+    Only jobs with a non-empty run_info.errors are returned, and of the
+    (potentially large) data column only those errors are fetched.
+
     Returns:
         List of job execution dicts with id, pipeline_id, data, etc.
+        data is reduced to {"run_info": {"errors": ...}}
     """
     if since is None:
         since = datetime.now(UTC) - timedelta(hours=24)
     if until is None:
         until = datetime.now(UTC)
 
-    query = text("""
-        SELECT
-            je.id,
-            je.pipeline_id,
-            je.session_id,
-            je.tenant_id,
-            je.status,
-            je.data,
-            je.started_at,
-            je.finished_at,
-            je.duration,
-            p.name as pipeline_name
-        FROM job_execution je
-        LEFT JOIN pipeline p ON je.pipeline_id = p.id
-        WHERE je.status = 'FAILURE'
-          AND je.finished_at >= :since
-          AND je.finished_at <= :until
-          AND je.data IS NOT NULL
-          AND je.data->>'run_info' IS NOT NULL
-        ORDER BY je.finished_at DESC
-        LIMIT :limit
-    """)
-
     params: dict[str, Any] = {
         "since": since,
         "until": until,
         "limit": limit,
     }
 
+    query = _FAILED_JOBS_QUERY
     if tenant_id:
-        query = text(query.text.replace(
-            "ORDER BY",
-            "AND je.tenant_id = :tenant_id ORDER BY"
-        ))
+        query = _FAILED_JOBS_BY_TENANT_QUERY
         params["tenant_id"] = str(tenant_id)
 
-    result = session.execute(query, params)
-    rows = result.fetchall()
+    # Stream rows in batches (a server-side cursor on Postgres) instead of
+    # holding every fetched row alongside the dicts built from them
+    rows = session.execute(query, params, execution_options={"yield_per": 200}).mappings()
 
     return [
         {
-            "id": str(row.id),
-            "pipeline_id": str(row.pipeline_id),
-            "pipeline_name": row.pipeline_name,
-            "session_id": str(row.session_id),
-            "tenant_id": str(row.tenant_id),
-            "status": row.status,
-            "data": row.data,
-            "started_at": row.started_at,
-            "finished_at": row.finished_at,
-            "duration": str(row.duration) if row.duration else None,
+            "id": row["id"],
+            "pipeline_id": row["pipeline_id"],
+            "pipeline_name": row["pipeline_name"],
+            "session_id": row["session_id"],
+            "tenant_id": row["tenant_id"],
+            "status": row["status"],
+            "data": {"run_info": {"errors": row["errors"]}},
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+            "duration": str(row["duration"]) if row["duration"] else None,
         }
         for row in rows
     ]
@@ -0,0 +1,43 @@
+"""Tests for the failure analysis job."""
+
+import contextlib
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from analyzer.job import FailureAnalyzerJob
+
+GOOD_JOB = {
+    "id": "job-1",
+    "pipeline_id": "pipeline-1",
+    "pipeline_name": "Pipeline",
+    "tenant_id": "tenant-1",
+    "data": {
+        "run_info": {
+            "errors": {
+                "fetch_data": [
+                    {"code": 500, "message": "Xledger timeout", "exception": "TimeoutError", "details": {}}
+                ]
+            }
+        }
+    },
+}
+
+
+def _run(jobs: list[dict[str, Any]]) -> Any:
+    """Run the analysis job without LLM or cache against the given failed jobs."""
+    with (
+        patch("analyzer.job.get_db_session", lambda: contextlib.nullcontext(MagicMock())),
+        patch("analyzer.job.get_failed_jobs", return_value=jobs),
+    ):
+        return FailureAnalyzerJob(use_llm=False, use_cache=False).run()
+
+
+@pytest.mark.parametrize("data", [{"run_info": "oops"}, ["not", "a", "mapping"]])
+def test_malformed_job_data_is_skipped(data: Any) -> None:
+    """Test a job whose data or run_info is not a mapping is skipped, not fatal."""
+    summary = _run([{**GOOD_JOB, "id": "job-2", "data": data}, GOOD_JOB])
+
+    assert summary.skipped_count == 1
+    assert [result.job_id for result in summary.results] == ["job-1"]
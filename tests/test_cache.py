@@ -0,0 +1,103 @@
+"""Tests for the LLM classification cache."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from classifier import FailureCategory, FailureClassifier
+from classifier.cache import ClassificationCache
+
+ERROR = {"code": 500, "message": "Something odd happened", "exception": "Error", "details": {}}
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> Path:
+    """Path for a temporary cache database."""
+    return tmp_path / "classifications.sqlite"
+
+
+def test_put_and_get(cache_file: Path) -> None:
+    """Test stored classifications are returned for the same error."""
+    cache = ClassificationCache(cache_file=cache_file, version="v1")
+    key = cache.key(ERROR)
+
+    cache.put_many({key: (FailureCategory.WORKFLOW_ENGINE, 0.8, "cached")})
+
+    assert cache.get_many([key]) == {key: (FailureCategory.WORKFLOW_ENGINE, 0.8, "cached")}
+
+
+def test_key_ignores_details_and_activity(cache_file: Path) -> None:
+    """Test the key only depends on message, exception and code."""
+    cache = ClassificationCache(cache_file=cache_file)
+
+    assert cache.key(ERROR) == cache.key({**ERROR, "details": {"request_id": "abc"}})
+    assert cache.key(ERROR) != cache.key({**ERROR, "code": 400})
+
+
+def test_key_masks_run_specific_ids(cache_file: Path) -> None:
+    """Test UUIDs, timestamps and long ids in the message do not change the key."""
+    cache = ClassificationCache(cache_file=cache_file)
+
+    first = {**ERROR, "message": "Run 3f2b8c1e-9d4a-4e5f-8a7b-1c2d3e4f5a6b failed at 2024-01-02T03:04:05Z (id 123456)"}
+    second = {**ERROR, "message": "Run 0a1b2c3d-4e5f-6789-abcd-ef0123456789 failed at 2024-02-03 10:11:12 (id 987654)"}
+
+    assert cache.key(first) == cache.key(second)
+    assert cache.key({**ERROR, "message": "HTTP 404"}) != cache.key({**ERROR, "message": "HTTP 500"})
+
+
+def test_version_change_misses(cache_file: Path) -> None:
+    """Test entries written under another model/prompt version are not served."""
+    old = ClassificationCache(cache_file=cache_file, version="v1")
+    old.put_many({old.key(ERROR): (FailureCategory.WORKFLOW_ENGINE, 0.8, "cached")})
+
+    new = ClassificationCache(cache_file=cache_file, version="v2")
+
+    assert new.get_many([new.key(ERROR)]) == {}
+
+
+def test_expired_entries_miss(cache_file: Path) -> None:
+    """Test entries older than the TTL are not served."""
+    cache = ClassificationCache(cache_file=cache_file, ttl_seconds=-1)
+    key = cache.key(ERROR)
+    cache.put_many({key: (FailureCategory.WORKFLOW_ENGINE, 0.8, "cached")})
+
+    assert cache.get_many([key]) == {}
+
+
+def test_expired_entries_pruned_on_open(cache_file: Path) -> None:
+    """Test opening the cache deletes entries older than the TTL."""
+    old = ClassificationCache(cache_file=cache_file, version="v1")
+    key = old.key(ERROR)
+    old.put_many({key: (FailureCategory.WORKFLOW_ENGINE, 0.8, "cached")})
+    old.close()
+
+    ClassificationCache(cache_file=cache_file, version="v2", ttl_seconds=-1).close()
+
+    assert ClassificationCache(cache_file=cache_file, version="v1").get_many([key]) == {}
+
+
+def test_classifier_reuses_cached_llm_result(cache_file: Path) -> None:
+    """Test a repeated error is answered from the cache instead of the LLM."""
+    response = MagicMock()
+    response.json.return_value = {
+        "choices": [
+            {"message": {"content": json.dumps(
+                {"category": "WORKFLOW_ENGINE", "confidence": 0.8, "reasoning": "from llm"}
+            )}}
+        ]
+    }
+
+    with (
+        patch("classifier.classifier.ClassificationCache", lambda version: ClassificationCache(cache_file, version)),
+        patch("classifier.classifier.requests.Session.post", return_value=response) as post,
+    ):
+        first = FailureClassifier(use_few_shot_learning=False).classify(ERROR)
+        second = FailureClassifier(use_few_shot_learning=False).classify(ERROR)
+
+    assert post.call_count == 1
+    assert first.classified_by == "llm"
+    assert second.classified_by == "cache"
+    assert second.category == FailureCategory.WORKFLOW_ENGINE
+    assert second.reasoning == "from llm"
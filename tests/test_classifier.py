@@ -1,16 +1,36 @@
 """Tests for the failure classifier."""
 
+import json
+import re
+from typing import Any
+from unittest.mock import MagicMock, patch
+
 import pytest
+import requests
 
 from classifier import FailureCategory, FailureClassifier
+from classifier.classifier import _RULES
+
+RULE_TEXTS = [
+    "Xledger timeout after validation failed",
+    "missing field 'id' | null value",
+    "KeyError: 'foo' NOT IN INDEX",
+    "valid\u0130tion fa\u0131led",
+    "nothing to see here",
+]
+
+
+def _first_rule_by_re(text: str) -> int | None:
+    """Index of the first rule whose pattern matches text, checking every pattern."""
+    return next((i for i, (_, _, pattern, _) in enumerate(_RULES) if pattern.search(text)), None)
 
 
 class TestFailureClassifier:
     """Tests for FailureClassifier."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self) -> FailureClassifier:
-        """Create classifier without LLM fallback for testing."""
+        """Create classifier without LLM fallback, shared since rule matching keeps no state."""
         return FailureClassifier(use_llm_fallback=False)
 
     def test_classify_input_data_validation_error(
@@ -194,3 +214,132 @@ class TestFailureClassifier:
         assert d["activity_name"] == "test_activity"
         assert d["classified_by"] == "rules"
         assert "original_error" in d
+
+    @pytest.mark.parametrize("text", RULE_TEXTS)
+    def test_rule_scanner_agrees_with_re(self, text: str) -> None:
+        """Test the hyperscan scanner picks the same first rule as the re patterns."""
+        pytest.importorskip("hyperscan")
+
+        assert FailureClassifier._first_matching_rule(text) == _first_rule_by_re(text)
+
+    @pytest.mark.parametrize("text", RULE_TEXTS)
+    def test_literal_prefilter_agrees_with_re(self, text: str) -> None:
+        """Test skipping rules by their required literal picks the same first rule."""
+        with patch("classifier.classifier._RULE_SCANNER", None):
+            assert FailureClassifier._first_matching_rule(text) == _first_rule_by_re(text)
+
+
+def _llm_response(content: Any) -> MagicMock:
+    """Build a mocked chat completions response returning content as JSON."""
+    response = MagicMock()
+    response.json.return_value = {"choices": [{"message": {"content": json.dumps(content)}}]}
+    return response
+
+
+UNMATCHED_ERROR = {"code": 500, "message": "Something odd happened", "exception": "Error", "details": {}}
+
+
+def _unmatched(i: int) -> dict[str, Any]:
+    """Build a distinct error that no rule matches."""
+    return {**UNMATCHED_ERROR, "message": f"Something odd happened #{i}"}
+
+
+RULE_ERROR = {"code": 500, "message": "Xledger error", "exception": "Error", "details": {}}
+
+
+class TestBatchClassification:
+    """Tests for batched LLM fallback classification."""
+
+    @pytest.fixture
+    def classifier(self) -> FailureClassifier:
+        """Create classifier with LLM fallback but no few-shot examples or cache."""
+        return FailureClassifier(use_few_shot_learning=False, use_cache=False)
+
+    def test_classify_batch_without_llm_keeps_order(self) -> None:
+        """Test rule matches and unknowns are returned in input order."""
+        classifier = FailureClassifier(use_llm_fallback=False)
+
+        results = classifier.classify_batch([(UNMATCHED_ERROR, "a"), (RULE_ERROR, "b"), (UNMATCHED_ERROR, "c")])
+
+        assert [r.activity_name for r in results] == ["a", "b", "c"]
+        assert [r.classified_by for r in results] == ["none", "rules", "none"]
+
+    def test_unmatched_errors_share_one_llm_request(self, classifier: FailureClassifier) -> None:
+        """Test several unmatched errors are classified by a single LLM call."""
+        content = [
+            {"idx": 1, "category": "WORKFLOW_ENGINE", "confidence": 0.8, "reasoning": "second"},
+            {"idx": 0, "category": "INPUT_DATA_QUALITY", "confidence": 0.7, "reasoning": "first"},
+        ]
+        with patch("classifier.classifier.requests.Session.post", return_value=_llm_response(content)) as post:
+            results = classifier.classify_batch([(_unmatched(0), "a"), (RULE_ERROR, "b"), (_unmatched(1), "c")])
+
+        assert post.call_count == 1
+        assert [r.category for r in results] == [
+            FailureCategory.INPUT_DATA_QUALITY,
+            FailureCategory.THIRD_PARTY_SYSTEM,
+            FailureCategory.WORKFLOW_ENGINE,
+        ]
+        assert [r.classified_by for r in results] == ["llm", "rules", "llm"]
+
+    def test_missing_batch_item_falls_back_to_single_call(self, classifier: FailureClassifier) -> None:
+        """Test errors missing from the batch response are retried individually."""
+        batch = [{"idx": 0, "category": "INPUT_DATA_QUALITY", "confidence": 0.7, "reasoning": "first"}]
+        single = {"category": "THIRD_PARTY_SYSTEM", "confidence": 0.6, "reasoning": "retried"}
+        with patch(
+            "classifier.classifier.requests.Session.post",
+            side_effect=[_llm_response(batch), _llm_response(single)],
+        ) as post:
+            results = classifier.classify_batch([(_unmatched(0), "a"), (_unmatched(1), "b")])
+
+        assert post.call_count == 2
+        assert [r.category for r in results] == [
+            FailureCategory.INPUT_DATA_QUALITY,
+            FailureCategory.THIRD_PARTY_SYSTEM,
+        ]
+        assert results[1].reasoning == "retried"
+
+    def test_batch_timeout_is_not_retried_per_error(self, classifier: FailureClassifier) -> None:
+        """Test a timed-out batch returns UNKNOWN for every error after one capped request."""
+        errors = [(_unmatched(i), f"act{i}") for i in range(classifier.llm_batch_size)]
+        with patch(
+            "classifier.classifier.requests.Session.post", side_effect=requests.exceptions.Timeout("slow")
+        ) as post:
+            results = classifier.classify_batch(errors)
+
+        assert post.call_count == 1
+        assert post.call_args.kwargs["timeout"] == FailureClassifier.LLM_MAX_BATCH_TIMEOUT_SECONDS
+        assert {r.category for r in results} == {FailureCategory.UNKNOWN}
+        assert len(results) == len(errors)
+
+    def test_parallel_batches_keep_order(self) -> None:
+        """Test results keep input order when batches are classified concurrently."""
+        classifier = FailureClassifier(
+            use_few_shot_learning=False, use_cache=False, llm_batch_size=2, llm_max_workers=3
+        )
+
+        def answer(*_args: Any, **kwargs: Any) -> MagicMock:
+            activities = re.findall(r"Activity: (\w+)", kwargs["json"]["messages"][1]["content"])
+            items = [
+                {"idx": idx, "category": "WORKFLOW_ENGINE", "confidence": 0.5, "reasoning": name}
+                for idx, name in enumerate(activities)
+            ]
+            return _llm_response(items if len(items) > 1 else items[0])
+
+        errors = [(_unmatched(i), f"act{i}") for i in range(7)]
+        with patch("classifier.classifier.requests.Session.post", side_effect=answer) as post:
+            results = classifier.classify_batch(errors)
+
+        assert post.call_count == 4
+        assert [r.reasoning for r in results] == [f"act{i}" for i in range(7)]
+
+    def test_repeated_errors_classified_once(self, classifier: FailureClassifier) -> None:
+        """Test identical errors from different activities share one LLM classification."""
+        single = {"category": "WORKFLOW_ENGINE", "confidence": 0.6, "reasoning": "shared"}
+        repeated = {**UNMATCHED_ERROR, "details": {"attempt": 2}}
+        with patch("classifier.classifier.requests.Session.post", return_value=_llm_response(single)) as post:
+            results = classifier.classify_batch([(UNMATCHED_ERROR, "a"), (repeated, "b")])
+
+        assert post.call_count == 1
+        assert [r.activity_name for r in results] == ["a", "b"]
+        assert [r.reasoning for r in results] == ["shared", "shared"]
+        assert results[1].original_error is repeated
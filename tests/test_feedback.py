@@ -1,7 +1,7 @@
 """Tests for feedback system."""
 
-import tempfile
-from pathlib import Path
+import json
+from unittest.mock import patch
 
 import pytest
 
@@ -10,16 +10,9 @@ from classifier.feedback import FeedbackStore
 
 
 @pytest.fixture
-def temp_feedback_file():
-    """Create a temporary feedback file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+def temp_feedback_file(tmp_path):
+    """Path for a temporary feedback file."""
+    return tmp_path / "feedback.jsonl"
 
 
 def test_add_correction(temp_feedback_file):
@@ -167,3 +160,137 @@ def test_persistence(temp_feedback_file):
     corrections = store2.get_corrections()
     assert corrections[0]["job_id"] == "test-123"
 
+
+def test_add_corrections(temp_feedback_file):
+    """Test recording several corrections at once."""
+    store = FeedbackStore(feedback_file=temp_feedback_file)
+    store.add_correction(
+        job_id="existing",
+        activity_name="test_activity",
+        error={"message": "Test error"},
+        original_category="WORKFLOW_ENGINE",
+        corrected_category="INPUT_DATA_QUALITY",
+    )
+
+    count = store.add_corrections([
+        {
+            "job_id": f"job-{i}",
+            "activity_name": "test_activity",
+            "error": {"message": f"Error {i}"},
+            "original_category": "THIRD_PARTY_SYSTEM",
+            "corrected_category": "WORKFLOW_ENGINE",
+            "notes": "Bulk import",
+        }
+        for i in range(3)
+    ])
+
+    assert count == 3
+    assert store.count() == 4
+
+    corrections = store.get_corrections(category=FailureCategory.WORKFLOW_ENGINE)
+    assert {c["job_id"] for c in corrections} == {"job-0", "job-1", "job-2"}
+    assert all(c["user"] is None and c["notes"] == "Bulk import" for c in corrections)
+
+
+def test_few_shot_examples_after_bulk_add_are_newest(temp_feedback_file):
+    """Test bulk-added corrections rank like individual adds, later rows newest."""
+    store = FeedbackStore(feedback_file=temp_feedback_file)
+    store.add_corrections([
+        {
+            "job_id": f"job-{i}",
+            "activity_name": f"activity_{i}",
+            "error": {"message": f"Error {i}"},
+            "original_category": "THIRD_PARTY_SYSTEM",
+            "corrected_category": "WORKFLOW_ENGINE",
+        }
+        for i in range(12)
+    ])
+
+    examples = store.get_few_shot_examples(max_examples=5)
+
+    assert [e["activity_name"] for e in examples] == [f"activity_{i}" for i in range(11, 6, -1)]
+    assert store.get_corrections(limit=1)[0]["job_id"] == "job-11"
+
+
+def test_add_corrections_empty(temp_feedback_file):
+    """Test an empty bulk add leaves the store unchanged."""
+    store = FeedbackStore(feedback_file=temp_feedback_file)
+
+    assert store.add_corrections([]) == 0
+    assert store.count() == 0
+
+
+def test_feedback_reused_until_file_changes(temp_feedback_file):
+    """Test the feedback file is parsed once and re-read after another writer changes it."""
+    store = FeedbackStore(feedback_file=temp_feedback_file)
+    store.add_correction(
+        job_id="job-1",
+        activity_name="test_activity",
+        error={"message": "Test error"},
+        original_category="WORKFLOW_ENGINE",
+        corrected_category="INPUT_DATA_QUALITY",
+    )
+    store.count()
+
+    with patch("classifier.feedback.json.loads") as loads:
+        assert store.count() == 1
+        store.get_corrections().clear()
+        assert store.count() == 1
+    loads.assert_not_called()
+
+    FeedbackStore(feedback_file=temp_feedback_file).add_correction(
+        job_id="job-2",
+        activity_name="test_activity",
+        error={"message": "Another error"},
+        original_category="WORKFLOW_ENGINE",
+        corrected_category="THIRD_PARTY_SYSTEM",
+    )
+
+    assert store.count() == 2
+
+
+def test_json_array_file_converted(tmp_path):
+    """Test feedback saved as a JSON array is converted to JSON lines and kept."""
+    legacy_file = tmp_path / "feedback.json"
+    legacy_file.write_text(json.dumps([
+        {
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "job_id": "old-job",
+            "activity_name": "test_activity",
+            "error": {"message": "Old error"},
+            "original_category": "WORKFLOW_ENGINE",
+            "corrected_category": "INPUT_DATA_QUALITY",
+            "user": None,
+            "notes": None,
+        }
+    ], indent=2))
+
+    store = FeedbackStore(feedback_file=tmp_path / "feedback.jsonl")
+    store.add_correction(
+        job_id="new-job",
+        activity_name="test_activity",
+        error={"message": "New error"},
+        original_category="WORKFLOW_ENGINE",
+        corrected_category="THIRD_PARTY_SYSTEM",
+    )
+
+    assert [c["job_id"] for c in store.get_corrections()] == ["new-job", "old-job"]
+    assert len(store.feedback_file.read_text().splitlines()) == 2
+
+
+def test_non_object_lines_skipped(temp_feedback_file):
+    """Test lines holding valid JSON that is not an object are skipped, not returned."""
+    record = {
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "job_id": "job-1",
+        "activity_name": "test_activity",
+        "error": {"message": "Test error"},
+        "original_category": "WORKFLOW_ENGINE",
+        "corrected_category": "INPUT_DATA_QUALITY",
+    }
+    temp_feedback_file.write_text(f'1\n"x"\n{json.dumps(record)}\nnull\n')
+
+    store = FeedbackStore(feedback_file=temp_feedback_file)
+
+    assert store.count() == 1
+    assert [c["job_id"] for c in store.get_corrections(category=FailureCategory.INPUT_DATA_QUALITY)] == ["job-1"]